@@ -104,6 +104,10 @@ class AppController:
         """Updates the shared application data."""
         self.app_data[key] = value
 
+    def update_app_data_bulk(self, values: Dict[str, Any]) -> None:
+        """Updates several shared application data keys at once."""
+        self.app_data.update(values)
+
     def get_app_data(self, key: str) -> Any:
         """Retrieves data from the shared application data."""
         return self.app_data.get(key)
@@ -137,8 +137,7 @@ class NetlistUploaderWindow(tk.Frame):
                 "quantity": "onoise",
             },
         }
-        for key, value in defaults.items():
-            self.controller.update_app_data(key, value)
+        self.controller.update_app_data_bulk(defaults)
 
     def upload_netlist(self) -> None:
         """Handles the netlist upload process."""
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Dict, Optional
-from .expression_evaluator import ExpressionEvaluator
+from .expression_evaluator import evaluator_for
 from ..ui_theme import (
     COLORS,
     FONTS,
@@ -31,11 +31,10 @@ class AddConstraintDialog(tk.Toplevel):
         self.all_allowed_vars_display = (
             parameters + node_expressions
         )  # For error messages
+        self._allowed_left_set = frozenset(self.all_allowed_vars_display)
         self.constraint: Optional[Dict[str, str]] = None
         # Pass the combined list to the evaluator
-        self.evaluator = ExpressionEvaluator(
-            parameters=parameters, node_expressions=node_expressions
-        )
+        self.evaluator = evaluator_for(frozenset(parameters), frozenset(node_expressions))
 
         container = create_card(self)
         container.pack(fill=tk.BOTH, expand=True, padx=24, pady=24)
@@ -138,8 +137,7 @@ class AddConstraintDialog(tk.Toplevel):
             return
 
         # left must be a single allowed symbol (parameter or node)
-        is_valid_left, _ = self.evaluator.validate_expression(left)
-        if left not in (self.parameters + self.node_expressions):
+        if left not in self._allowed_left_set:
             messagebox.showerror(
                 "Validation Error",
                 f"Invalid left-hand side: '{left}'. Must be one of: {', '.join(self.all_allowed_vars_display)}",
@@ -178,23 +176,24 @@ class AddConstraintDialog(tk.Toplevel):
         self.destroy()
 
     def is_valid_input(self, input_str: str) -> bool:
-        """Validates the right-hand side string as either a valid expression or a number."""
-        # 1. Try to validate as an expression using the evaluator
+        """Validates the right-hand side string as either a number or a valid expression."""
+        # 1. Numbers are by far the common case; check them before parsing an expression
+        try:
+            # TODO: Enhance to handle SI units like '1k', '0.1u' if desired
+            float(input_str)
+            return True  # It's a valid number
+        except ValueError:
+            pass
+
+        # 2. Otherwise validate as an expression using the evaluator
         is_valid_expr, used_vars = self.evaluator.validate_expression(input_str)
 
         if is_valid_expr:
-            # --- REMOVED REDUNDANT LOOP ---
             # If validate_expression returned True, the variables used are already confirmed
             # to be within the evaluator's allowed set (parameters + mangled nodes).
             return True  # It's a valid expression
-
-        # 2. If not a valid expression, check if it's a valid number
-        try:
-            # TODO: Enhance to handle SI units like '1k', '0.1u' if desired
-            float(input_str)
-            return True  # It's a valid number
-        except ValueError:
-            # If it's neither a valid expression nor a valid number
+        else:
+            # If it's neither a valid number nor a valid expression
             messagebox.showerror(
                 "Validation Error",
                 f"Invalid right-hand side: '{input_str}'.\nMust be a valid number or expression using allowed terms.",
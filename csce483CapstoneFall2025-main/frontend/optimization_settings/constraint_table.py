@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional, Sequence, Set
+
+# Above this many rows only the visible window is inserted into the Treeview
+_VIRTUAL_THRESHOLD = 200
+_COLUMNS = ("Left", "Operator", "Right", "X-Range")
 
 
 class ConstraintTable(ttk.Treeview):
@@ -11,7 +15,7 @@ class ConstraintTable(ttk.Treeview):
         remove_callback: Callable[[], None],
         edit_callback: Callable[[Dict[str, str], int], None],
     ):
-        super().__init__(parent, columns=("Left", "Operator", "Right", "X-Range"), show="headings")
+        super().__init__(parent, columns=_COLUMNS, show="headings")
         self.heading("Left", text="Left")
         self.heading("Operator", text="Operator")
         self.heading("Right", text="Right")
@@ -25,7 +29,50 @@ class ConstraintTable(ttk.Treeview):
         self.add_callback = add_callback
         self.remove_callback = remove_callback
         self.edit_callback = edit_callback
-        
+
+        # Source of truth for every row; large tables only show a window of it
+        self._rows: List[Dict[str, str]] = []
+        self._offset = 0
+        # Displayed iid -> index into self._rows, so lookups skip Tk's linear index scan
+        self._iid_to_index: Dict[str, int] = {}
+        # Row indices selected in windowed mode, kept while they are scrolled out of view
+        self._selected_indices: Set[int] = set()
+        # Scrollbar callback; windowed mode reports the window's place in all rows
+        self._yscroll: Optional[Callable[[float, float], None]] = None
+        self.bind("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind("<Button-4>", lambda e: self._scroll_rows(-1), add="+")
+        self.bind("<Button-5>", lambda e: self._scroll_rows(1), add="+")
+        for sequence, step in (
+            ("<Up>", -1), ("<Down>", 1), ("<Prior>", "-page"), ("<Next>", "page"),
+            ("<Home>", "home"), ("<End>", "end"),
+        ):
+            self.bind(sequence, lambda e, step=step: self._on_key(step))
+
+    def attach_scrollbar(self, scrollbar: ttk.Scrollbar):
+        """Drive a vertical scrollbar that covers every constraint, not just the shown window."""
+        self._yscroll = scrollbar.set
+        scrollbar.configure(command=self.yview)
+        super().configure(yscrollcommand=self._on_tree_yscroll)
+
+    def _on_tree_yscroll(self, first, last):
+        if self._yscroll is not None:
+            self._yscroll(*(self.yview() if self._is_virtual() else (first, last)))
+
+    def yview(self, *args):
+        """Treeview.yview that scrolls through all rows once the table is windowed."""
+        if not self._is_virtual():
+            return super().yview(*args)
+        total = len(self._rows)
+        count = self._visible_count()
+        if not args:
+            return self._offset / total, min(1.0, (self._offset + count) / total)
+        if args[0] == "moveto":
+            self._set_offset(int(round(float(args[1]) * total)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self._set_offset(self._offset + (step * count if args[2] == "pages" else step))
+        return None
+
     def _fmt_xrange(self, cdict):
         xmin = cdict.get("x_min", None)
         xmax = cdict.get("x_max", None)
@@ -36,32 +83,144 @@ class ConstraintTable(ttk.Treeview):
         if xmax is None:
             return f"({xmin} .. +inf)"
         return f"[{xmin} .. {xmax}]"
-    
-    def add_constraint(self, constraint: Dict[str, str]):
-        self.insert(
-            "",
-            tk.END,
-            values=(
-                constraint["left"],
-                constraint["operator"],
-                constraint["right"],
-                self._fmt_xrange(constraint),
-            ),
+
+    def _row_values(self, constraint: Dict[str, str]):
+        return (
+            constraint["left"],
+            constraint["operator"],
+            constraint["right"],
+            self._fmt_xrange(constraint),
         )
 
-    def remove_constraint(self):
-        """Removes the selected constraint."""
-        selected_items = self.selection()
-        if not selected_items:
-            messagebox.showinfo("Info", "Please select a constraint to remove.")
+    def _is_virtual(self) -> bool:
+        return len(self._rows) > _VIRTUAL_THRESHOLD
+
+    def _visible_count(self) -> int:
+        return int(self.cget("height") or 10)
+
+    def _render_rows(self, keep_selection: bool = True):
+        """Re-insert the rows that should be on screen (all of them, or the current window)."""
+        if keep_selection:
+            shown = self._iid_to_index
+            self._selected_indices.difference_update(shown.values())
+            self._selected_indices.update(shown[iid] for iid in self.selection() if iid in shown)
+        else:
+            self._selected_indices = set()
+        focus_index = self._iid_to_index.get(self.focus())
+        if self._is_virtual():
+            count = self._visible_count()
+            self._offset = max(0, min(self._offset, len(self._rows) - count))
+            rows = self._rows[self._offset:self._offset + count]
+        else:
+            self._offset = 0
+            rows = self._rows
+        self.configure(displaycolumns=())
+        try:
+            self.delete(*self.get_children())
+            offset = self._offset
+            self._iid_to_index = {
+                self.insert("", tk.END, values=self._row_values(constraint)): offset + position
+                for position, constraint in enumerate(rows)
+            }
+        finally:
+            self.configure(displaycolumns=_COLUMNS)
+        index_to_iid = {index: iid for iid, index in self._iid_to_index.items()}
+        reselect = [index_to_iid[i] for i in self._selected_indices if i in index_to_iid]
+        if reselect:
+            self.selection_set(reselect)
+        if focus_index in index_to_iid:
+            self.focus(index_to_iid[focus_index])
+        if self._yscroll is not None and self._is_virtual():
+            self._yscroll(*self.yview())
+
+    def _set_offset(self, offset: int):
+        if offset != self._offset:
+            self._offset = offset
+            self._render_rows()
+
+    def _scroll_rows(self, delta: int):
+        if not self._is_virtual():
+            return None  # let the Treeview scroll its own items
+        self._set_offset(self._offset + delta)
+        return "break"
+
+    def _on_mousewheel(self, event):
+        if not event.delta:
+            return None
+        delta = int(-1 * (event.delta / 120)) or (-1 if event.delta > 0 else 1)
+        return self._scroll_rows(delta)
+
+    def _on_key(self, step):
+        """Keyboard navigation across the whole list, moving the window as needed."""
+        if not self._is_virtual():
+            return None  # the Treeview's own bindings handle a fully inserted list
+        total = len(self._rows)
+        count = self._visible_count()
+        current = self._iid_to_index.get(self.focus(), self._offset)
+        if step == "home":
+            target = 0
+        elif step == "end":
+            target = total - 1
+        elif step == "page":
+            target = current + count
+        elif step == "-page":
+            target = current - count
+        else:
+            target = current + step
+        target = max(0, min(target, total - 1))
+        if target < self._offset:
+            self._offset = target
+        elif target >= self._offset + count:
+            self._offset = target - count + 1
+        self._render_rows(keep_selection=False)
+        iid = next(iid for iid, index in self._iid_to_index.items() if index == target)
+        self.selection_set(iid)
+        self.focus(iid)
+        return "break"
+
+    def index_of(self, item_id: str) -> int:
+        """Position of a displayed row within all constraints."""
+        return self._iid_to_index[item_id]
+
+    def add_constraint(self, constraint: Dict[str, str]):
+        self._rows.append(constraint)
+        if len(self._rows) == _VIRTUAL_THRESHOLD + 1:
+            self._render_rows()  # switching to windowed mode
+        elif not self._is_virtual() or len(self._iid_to_index) < self._visible_count():
+            item_id = self.insert("", tk.END, values=self._row_values(constraint))
+            self._iid_to_index[item_id] = len(self._rows) - 1
+
+    def add_constraints_bulk(self, constraints: List[Dict[str, str]]):
+        """Insert many constraints with the columns hidden, so the table lays out once."""
+        if not constraints:
             return
+        self._rows.extend(constraints)
+        self._render_rows(keep_selection=False)
+
+    def remove_rows(self, item_ids: Sequence[str]) -> List[int]:
+        """Remove displayed rows; returns their constraint indices, highest first."""
+        if len(item_ids) == len(self._rows):
+            # Everything is selected: one bulk clear instead of per-row deletes
+            indices = list(range(len(self._rows) - 1, -1, -1))
+            self.clear()
+            return indices
+        indices = sorted((self.index_of(item_id) for item_id in item_ids), reverse=True)
+        was_virtual = self._is_virtual()
+        for index in indices:
+            del self._rows[index]
+        if was_virtual:
+            self._render_rows(keep_selection=False)
+        else:
+            self.delete(*item_ids)
+            self._iid_to_index = {
+                item_id: position for position, item_id in enumerate(self.get_children())
+            }
+        return indices
 
-        for selected_item in reversed(selected_items):
-            index = self.index(
-                selected_item
-            )  # get the index BEFORE deleting from treeview
-            self.delete(selected_item)  # delete from the tree
-            self.remove_callback()
+    def remove_constraint(self):
+        """Removes the selected constraint."""
+        # The owner removes the whole selection (rows and its own list) in one pass
+        self.remove_callback()
 
     def edit_constraint(self):
         """Opens the EditConstraintDialog for the selected constraint."""
@@ -74,7 +233,7 @@ class ConstraintTable(ttk.Treeview):
             return
 
         selected_item = selected_items[0]
-        index = self.index(selected_item)
+        index = self.index_of(selected_item)
         #  CRUCIAL: We need to get the constraint data *from the Treeview*,
         #   NOT from the potentially outdated self.controller.constraints.
         values = self.item(selected_item, "values")
@@ -82,18 +241,16 @@ class ConstraintTable(ttk.Treeview):
         self.edit_callback(constraint, index)  # Call the edit callback
 
     def update_constraint(self, index: int, constraint: Dict[str, str]):
-        item_id = self.get_children()[index]
-        self.item(
-            item_id,
-            values=(
-                constraint["left"],
-                constraint["operator"],
-                constraint["right"],
-                self._fmt_xrange(constraint),
-            ),
-        )
+        self._rows[index] = constraint
+        children = self.get_children()
+        position = index - self._offset
+        if 0 <= position < len(children):
+            self.item(children[position], values=self._row_values(constraint))
 
     def clear(self):
         """Removes all constraints from the Treeview."""
-        for item in self.get_children():
-            self.delete(item)
+        self._rows = []
+        self._offset = 0
+        self._iid_to_index = {}
+        self._selected_indices = set()
+        self.delete(*self.get_children())
@@ -4,19 +4,81 @@ from .visual_curve_editors import open_heaviside_editor, open_piecewise_editor
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
+import bisect
 import csv
+import itertools
 import re
 from enum import Enum
 from ..ui_theme import COLORS, create_primary_button, create_secondary_button
 
+_CONSTRAINT_OPS = frozenset(("=", ">=", "<="))
+# Curve files are parsed in bounded chunks and capped so huge uploads cannot exhaust memory
+_CSV_CHUNK_ROWS = 100_000
+_CSV_PROBE_BYTES = 4096
+_MAX_CURVE_ROWS = 1_000_000
+_TARGET_POINTS = 100
+_UNIT_GRID = np.linspace(0.0, 1.0, _TARGET_POINTS)
+_V_RE = re.compile(r"v\s*\((.+)\)", re.IGNORECASE)
+_AC_PREFIXES = ("vm(", "vp(", "vr(", "vi(")
+# For magnitude_db we still request VM and convert later
+_AC_RESPONSE_PREFIX = {"phase": "VP", "real": "VR", "imag": "VI"}
+_NOISE_QUANTITY_UNITS = {
+    "onoise": ("Output noise", "V/√Hz"),
+    "onoise_db": ("Output noise", "dB/√Hz"),
+    "inoise": ("Input-referred noise", "V/√Hz"),
+    "inoise_db": ("Input-referred noise", "dB/√Hz"),
+}
 
 class input_type(Enum):
     HEAVISIDE = 2
     UPLOAD = 3
     PIECEWISE  = 4
 
+class _XRangeIndex:
+    """
+    Sorted store of the x-ranges already claimed by target functions.
+    Stored ranges never overlap (the overlap check rejects them), so ordering
+    by start also orders by end and one bisect finds the only candidate.
+    """
+    def __init__(self):
+        # Parallel float lists so bisect compares plain floats, not tuples
+        self._starts = []
+        self._ends = []
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        return zip(self._starts, self._ends)
+
+    def overlaps(self, start, end) -> bool:
+        # Every range left of i starts before `end`; the last one ends furthest right
+        i = bisect.bisect_left(self._starts, end)
+        return i > 0 and self._ends[i - 1] > start
+
+    def _position(self, start, end) -> int:
+        i = bisect.bisect_left(self._starts, start)
+        while i < len(self._starts) and self._starts[i] == start and self._ends[i] < end:
+            i += 1
+        return i
+
+    def add(self, start, end) -> None:
+        i = self._position(start, end)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+
+    def remove(self, start, end) -> None:
+        i = self._position(start, end)
+        if i < len(self._starts) and self._starts[i] == start and self._ends[i] == end:
+            del self._starts[i]
+            del self._ends[i]
+
+    def clear(self) -> None:
+        self._starts.clear()
+        self._ends.clear()
+
 class CurveFitSettings(tk.Frame):
     def __init__(self, parent: tk.Frame, parameters: List[str], nodes, controller: "AppController", inputs_completed_callback=None):
         super().__init__(parent, bg=COLORS["bg_secondary"], bd=0, highlightthickness=0)
@@ -30,7 +92,9 @@ class CurveFitSettings(tk.Frame):
         self.generated_data = None
         self.current_noise_settings: Dict[str, Any] = {}
         self.inputs_completed = False
-        self.time_tuples_list = []
+        self.time_tuples_list = _XRangeIndex()
+        self._left_options_cache: List[str] = []
+        self._left_options_key = None
 
         # --- combobox for: line input vs heavyside vs custom csv
         self.select_input_type_frame = ttk.Frame(self, style="Card.TFrame")
@@ -93,6 +157,15 @@ class CurveFitSettings(tk.Frame):
         ).pack(fill=tk.X, pady=4)
 
         self.func_model = []  # list of {"type": "...", "params": (...)}
+        self._row_ids: List[str] = []  # Treeview iids, parallel to func_model
+        self._ranges: Dict[str, Tuple[float, float]] = {}  # iid -> x-range held in time_tuples_list
+        # Scratch buffers reused by every add/edit instead of fresh linspace arrays.
+        # Kept in float64: their samples are published as the optimizer's target
+        self._x_scratch = np.empty(_TARGET_POINTS)
+        self._y_scratch = np.empty(_TARGET_POINTS)
+        self._pending_after = None
+        self._heaviside_last = None  # (raw entry texts, parsed floats) from the last editor open
+        self._last_emitted: Dict[str, Any] = {}
         self.custom_functions = []
         self.analysis_type = "transient"
         self.ac_response = "magnitude"
@@ -100,6 +173,7 @@ class CurveFitSettings(tk.Frame):
             "magnitude": "Magnitude",
             "phase": "Phase",
         }
+        self._ac_response_by_label = {label: value for value, label in self.ac_response_options.items()}
 
         # --- X and Y Parameter Dropdowns and Expressions ---
         self.x_parameter_var = tk.StringVar(value="TIME")
@@ -149,9 +223,17 @@ class CurveFitSettings(tk.Frame):
         )
         self.ac_response_dropdown.pack(side=tk.LEFT, padx=5)
         self.ac_response_dropdown.bind("<<ComboboxSelected>>", self.on_ac_response_selected)
-        self.ac_response_frame.pack(side=tk.LEFT)
-        self.ac_response_frame.pack_forget()
+        self._ac_response_shown = False  # mapped state tracked here, not queried from Tk
     
+    def _show_ac_response(self, show: bool) -> None:
+        if show == self._ac_response_shown:
+            return
+        self._ac_response_shown = show
+        if show:
+            self.ac_response_frame.pack(side=tk.LEFT)
+        else:
+            self.ac_response_frame.pack_forget()
+
     def custom_x_inputs_are_valid(self, x_start, x_end) -> bool:
         if self.analysis_type in {"ac", "noise"}:
             if x_start <= 0:
@@ -172,36 +254,16 @@ class CurveFitSettings(tk.Frame):
             return False
         return True
 
-    def is_intersecting(self, tuple1, tuple2) -> bool:
-        # Check if two intervals intersect
-        start1, end1 = tuple1 
-        start2, end2 = tuple2 
-        return start1 < end2 and start2 < end1
-
-
     def check_if_in_previous_x_ranges(self, time_tuple) -> bool:
-        # Iterate through each tuple in the list and check for intersection
-        for existing_tuple in self.time_tuples_list:
-            if self.is_intersecting(existing_tuple, time_tuple):
-                messagebox.showerror("Input Error", "The time range you entered overlaps with a previously defined range. Please enter a non-overlapping time range.")
-                return True # Return True if an intersection is found
+        # Bisect the sorted range index instead of scanning every stored range
+        if self.time_tuples_list.overlaps(*time_tuple):
+            messagebox.showerror("Input Error", "The time range you entered overlaps with a previously defined range. Please enter a non-overlapping time range.")
+            return True # Return True if an intersection is found
         return False # Return False if no intersections are found
         
     def _add_heaviside_from_visual_editor(self, amplitude, t0, x1):
         """Helper method to add a heaviside function from visual editor parameters"""
-        # Create mock entry objects that return the values
-        class MockEntry:
-            def __init__(self, value):
-                self.value = str(value)
-            def get(self):
-                return self.value
-        
-        amplitude_entry = MockEntry(amplitude)
-        t0_entry = MockEntry(t0)
-        x1_entry = MockEntry(x1)
-        
-        # Call the existing add_function method
-        self.add_function(input_type.HEAVISIDE, amplitude_entry, t0_entry, x1_entry, "")
+        self.add_function(input_type.HEAVISIDE, float(amplitude), float(t0), float(x1))
 
     def create_heaviside_frame(self):
         heaviside_frame = tk.Frame(
@@ -232,11 +294,12 @@ class CurveFitSettings(tk.Frame):
         ).pack(side=tk.LEFT)
         heaviside_end_x = tk.Entry(heaviside_frame, width=5); heaviside_end_x.pack(side=tk.LEFT)
         def _open_editor():
-            amp = float(heaviside_amplitude.get() or 1.0)
-            t0 = float(heaviside_start_x.get() or 0.0)
-            x1 = float(heaviside_end_x.get() or 1.0)
+            seed = self._parse_heaviside_seed(heaviside_amplitude, heaviside_start_x, heaviside_end_x)
+            if seed is None:
+                return
+            amp, t0, x1 = seed
 
-            def _on_change(a, t_start, t_end):
+            def _commit_entries(a, t_start, t_end):
                 heaviside_amplitude.delete(0, tk.END); heaviside_amplitude.insert(0, str(a))
                 heaviside_start_x.delete(0, tk.END);   heaviside_start_x.insert(0, str(t_start))
                 heaviside_end_x.delete(0, tk.END);     heaviside_end_x.insert(0, str(t_end))
@@ -246,7 +309,7 @@ class CurveFitSettings(tk.Frame):
                 amp,
                 t0,
                 x1,
-                on_change=_on_change,
+                on_change=lambda a, t_start, t_end: self._debounced(_commit_entries, a, t_start, t_end),
                 on_apply=lambda a, t_start, t_end: self._add_heaviside_from_visual_editor(a, t_start, t_end),
                 on_save_constraint=self.push_constraint_from_editor,
                 axis_labels=self._current_axis_labels(),
@@ -257,12 +320,11 @@ class CurveFitSettings(tk.Frame):
         self.heaviside_button = create_primary_button(
             heaviside_frame,
             text="Add Heaviside",
-            command=lambda: self.add_function(
+            command=lambda: self.add_function_from_entries(
                 input_type.HEAVISIDE,
                 heaviside_amplitude,
                 heaviside_start_x,
                 heaviside_end_x,
-                "",
             ),
         )
         self.heaviside_button.pack(side=tk.LEFT, padx=10, pady=(4, 2))
@@ -306,7 +368,21 @@ class CurveFitSettings(tk.Frame):
             span = (xb - xa) if xb > xa else 1.0
             t = np.zeros_like(X); t[mask] = (X[mask] - xa) / span
             Y[mask] = ya + t[mask]*(yb - ya)
-        return [[float(x), float(y)] for x, y in zip(X, Y)]
+        return np.column_stack((X, Y))
+
+    def _fill_linspace(self, a, b):
+        """Equivalent of np.linspace(a, b, 100) written into the shared x buffer."""
+        xs = self._x_scratch
+        np.multiply(_UNIT_GRID, b - a, out=xs)
+        xs += a
+        xs[-1] = b
+        return xs
+
+    def _publish_generated(self, xy):
+        """Store an (N, 2) array of target samples and share it with the controller."""
+        # Published as a contiguous ndarray; consumers convert at their own boundary
+        self.generated_data = xy
+        self.controller.update_app_data("generated_data", self.generated_data)
 
     def _segments_from_piecewise(self, pts):
         segs = []
@@ -380,14 +456,12 @@ class CurveFitSettings(tk.Frame):
             # commit model/list
             item = {"type":"PIECEWISE", "params": pts}
             self.func_model.append(item)
-            self.time_tuples_list.append((x0, x1))
-            self.func_list.insert("", "end", values=("PIECEWISE", f"{len(pts)} points", f"[{x0} to {x1}]"))
+            self.time_tuples_list.add(x0, x1)
+            self._insert_row(("PIECEWISE", f"{len(pts)} points", f"[{x0} to {x1}]"))
+            self._ranges[self._row_ids[-1]] = (x0, x1)
             # preview data & exporter segments
-            data_points = self._build_piecewise_series(pts)
-            self.generated_data = data_points
-            self.controller.update_app_data("generated_data", data_points)
-            if self.inputs_completed_callback:
-                self.inputs_completed_callback("function_button_pressed", True)
+            self._publish_generated(self._build_piecewise_series(pts))
+            self._emit("function_button_pressed", True)
             self._rebuild_all_line_segments()
 
         self._add_piecewise_callback = _add_piecewise
@@ -441,35 +515,87 @@ class CurveFitSettings(tk.Frame):
         self.generated_data = None
         # Only clear the table rows, keep the widget
         try:
-            for iid in self.func_list.get_children():
-                self.func_list.delete(iid)
+            self.func_list.delete(*self.func_list.get_children())
         except Exception:
             pass
         # Reset state/buttons
         self.heaviside_button.config(state=tk.NORMAL)
         self.func_model.clear()
+        self._row_ids.clear()
+        self._ranges.clear()
         self.time_tuples_list.clear()
 
 
-    def add_function(self, in_type, arg1, arg2, arg3, arg4):
+    def _emit(self, key, val):
+        """Forward a state change to the settings window, skipping repeats of the last value."""
+        if self._last_emitted.get(key) == val:
+            return
+        self._last_emitted[key] = val
+        if self.inputs_completed_callback:
+            self.inputs_completed_callback(key, val)
+
+    def _debounced(self, fn, *args, delay=30):
+        """Coalesce rapid editor callbacks so only the last call in `delay` ms runs."""
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+
+        def _run():
+            self._pending_after = None
+            fn(*args)
+
+        self._pending_after = self.after(delay, _run)
+
+    def _parse_heaviside_seed(self, amp_entry, start_entry, end_entry):
+        """Parse the editor's starting values, reusing the last parse if the text is unchanged."""
+        raw = (amp_entry.get(), start_entry.get(), end_entry.get())
+        if self._heaviside_last is not None and self._heaviside_last[0] == raw:
+            return self._heaviside_last[1]
+        try:
+            vals = tuple(float(text or default) for text, default in zip(raw, (1.0, 0.0, 1.0)))
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter numeric values before opening the editor.")
+            return None
+        self._heaviside_last = (raw, vals)
+        return vals
+
+    def _parse_floats(self, *entries):
+        """Read and parse every entry once; returns None after reporting bad input."""
+        try:
+            return tuple(float(entry.get()) for entry in entries)
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter numeric values for every field.")
+            return None
+
+    def _insert_row(self, values):
+        """Append a (type, desc, range) row to the function list and track its iid."""
+        self._row_ids.append(self.func_list.insert("", "end", values=values))
+
+    def add_function_from_entries(self, in_type, *entries):
+        """Button entry point: parse each entry once and forward the floats to add_function."""
+        vals = self._parse_floats(*entries)
+        if vals is None: return
+        self.add_function(in_type, *vals)
+
+    def add_function(self, in_type, *vals):
+        """Add a target function from already-parsed floats; HEAVISIDE takes (amplitude, x_start, x_end)."""
         if in_type == input_type.HEAVISIDE:
-            amplitude = float(arg1.get()); x_start = float(arg2.get()); x_end = float(arg3.get())
+            amplitude, x_start, x_end = vals
             if not self.custom_x_inputs_are_valid(x_start, x_end): return
             if self.check_if_in_previous_x_ranges((x_start, x_end)): return
 
-            self.time_tuples_list.append((x_start, x_end))
+            self.time_tuples_list.add(x_start, x_end)
             self.custom_functions.append((amplitude, x_start, x_end))
 
-            x_values = np.linspace(x_start, x_end, 100)
-            y_values = [amplitude if x >= x_start else 0 for x in x_values]
-            self.generated_data = [[float(x), float(y)] for x, y in zip(x_values, y_values)]
-            self.controller.update_app_data("generated_data", self.generated_data)
-            if self.inputs_completed_callback:
-                self.inputs_completed_callback("function_button_pressed", True)
+            x_values = self._fill_linspace(x_start, x_end)
+            # The grid never dips below x_start, so the step is flat over it
+            self._y_scratch.fill(amplitude)
+            self._publish_generated(np.column_stack((x_values, self._y_scratch)))
+            self._emit("function_button_pressed", True)
 
             item = {"type":"HEAVISIDE", "params":(amplitude, x_start, x_end)}
             self.func_model.append(item)
-            self.func_list.insert("", "end", values=("HEAVISIDE", f"amplitude = {amplitude}", f"[{x_start} to {x_end}]"))
+            self._insert_row(("HEAVISIDE", f"amplitude = {amplitude}", f"[{x_start} to {x_end}]"))
+            self._ranges[self._row_ids[-1]] = (x_start, x_end)
             self._rebuild_all_line_segments()
 
         else:
@@ -486,27 +612,13 @@ class CurveFitSettings(tk.Frame):
         if idx is None:
             return
 
-        item = self.func_model.pop(idx)
-
-        # CHANGED: compute the range per type
-        if item["type"] == "HEAVISIDE":
-            _, x0, x1 = item["params"]
-        elif item["type"] == "PIECEWISE":
-            pts = item["params"]
-            xs = [p[0] for p in pts] if pts else []
-            if xs:
-                x0, x1 = min(xs), max(xs)
-            else:
-                x0, x1 = 0.0, 0.0
-        else:
-            x0, x1 = 0.0, 0.0  # safety
-
-        try:
-            self.time_tuples_list.remove((x0, x1))
-        except ValueError:
-            pass
+        self.func_model.pop(idx)
+        row_id = self._row_ids.pop(idx)
+        rng = self._ranges.pop(row_id, None)
+        if rng is not None:
+            self.time_tuples_list.remove(*rng)
 
-        self.func_list.delete(self.func_list.get_children()[idx])
+        self.func_list.delete(row_id)
 
         if not self.func_model:
             self.heaviside_button.config(state=tk.NORMAL)
@@ -519,35 +631,31 @@ class CurveFitSettings(tk.Frame):
         if idx is None:
             return
         item = self.func_model[idx]
+        row_id = self._row_ids[idx]
         if item["type"] == "HEAVISIDE":
             amp, x0, x1 = item["params"]
-            curr_range = (x0, x1)
             def _apply(a, t0, x1_new):
-                nonlocal curr_range, x0, x1
-                try:
-                    self.time_tuples_list.remove(curr_range)
-                except ValueError:
-                    pass
+                curr_range = self._ranges.get(row_id)
+                if curr_range is None or not self.func_list.exists(row_id):
+                    return  # the row was removed while the editor was open
+                pos = self._row_ids.index(row_id)
+                self.time_tuples_list.remove(*curr_range)
 
                 if self.check_if_in_previous_x_ranges((t0, x1_new)):
-                    self.time_tuples_list.append(curr_range)
+                    self.time_tuples_list.add(*curr_range)
                     return
 
-                self.func_model[idx] = {"type": "HEAVISIDE", "params": (a, t0, x1_new)}
-                xs = np.linspace(t0, x1_new, 100)
-                ys = [a if x >= t0 else 0 for x in xs]
-                self.generated_data = [[float(x), float(y)] for x, y in zip(xs, ys)]
-                self.controller.update_app_data("generated_data", self.generated_data)
-                if self.inputs_completed_callback:
-                    self.inputs_completed_callback("function_button_pressed", True)
+                self.func_model[pos] = {"type": "HEAVISIDE", "params": (a, t0, x1_new)}
+                xs = self._fill_linspace(t0, x1_new)
+                self._y_scratch.fill(a)
+                self._publish_generated(np.column_stack((xs, self._y_scratch)))
+                self._emit("function_button_pressed", True)
 
                 desc = f"amplitude = {a}; from x = [{t0} to {x1_new}]"
-                row_id = self.func_list.get_children()[idx]
                 self.func_list.item(row_id, values=("HEAVISIDE", desc, f"[{t0} to {x1_new}]"))
 
-                self.time_tuples_list.append((t0, x1_new))
-                curr_range = (t0, x1_new)
-                x0, x1 = t0, x1_new
+                self.time_tuples_list.add(t0, x1_new)
+                self._ranges[row_id] = (t0, x1_new)
                 self._rebuild_all_line_segments()
             open_heaviside_editor(
                 self,
@@ -562,49 +670,43 @@ class CurveFitSettings(tk.Frame):
             )
         else:
             pts = item["params"]  # list of (x,y)
-            # compute and remember the current x-range for overlap tracking
-            xs = [p[0] for p in pts]
-            curr_range = (min(xs), max(xs)) if xs else (0.0, 0.0)
 
             def _on_change(new_pts):
                 # Live-apply from the editor
-                nonlocal curr_range
                 if len(new_pts) < 2:
                     return  # need at least two points to form a segment
 
+                curr_range = self._ranges.get(row_id)
+                if curr_range is None or not self.func_list.exists(row_id):
+                    return  # the row was removed while the editor was open
+                pos = self._row_ids.index(row_id)
+
                 # Temporarily remove old range so we don't collide with ourselves
-                try:
-                    self.time_tuples_list.remove(curr_range)
-                except ValueError:
-                    pass
+                self.time_tuples_list.remove(*curr_range)
 
                 xs_new = [p[0] for p in new_pts]
                 new_range = (min(xs_new), max(xs_new))
 
                 if self.check_if_in_previous_x_ranges(new_range):
                     # restore old range and abort this change
-                    self.time_tuples_list.append(curr_range)
+                    self.time_tuples_list.add(*curr_range)
                     return
 
                 # Commit model
-                self.func_model[idx] = {"type": "PIECEWISE", "params": list(new_pts)}
+                self.func_model[pos] = {"type": "PIECEWISE", "params": list(new_pts)}
 
                 # Preview data
-                data_points = self._build_piecewise_series(new_pts)
-                self.generated_data = data_points
-                self.controller.update_app_data("generated_data", data_points)
-                if self.inputs_completed_callback:
-                    self.inputs_completed_callback("function_button_pressed", True)
+                self._publish_generated(self._build_piecewise_series(new_pts))
+                self._emit("function_button_pressed", True)
 
                 # Update UI row
-                row_id = self.func_list.get_children()[idx]
                 desc = f"{len(new_pts)} points"
                 rng  = f"[{new_range[0]} to {new_range[1]}]"
                 self.func_list.item(row_id, values=("PIECEWISE", desc, rng))
 
                 # Track new range and rebuild exporter segments
-                self.time_tuples_list.append(new_range)
-                curr_range = new_range
+                self.time_tuples_list.add(*new_range)
+                self._ranges[row_id] = new_range
                 self._rebuild_all_line_segments()  # ADDED
 
             # Open the PIECEWISE editor with live on_change
@@ -628,21 +730,71 @@ class CurveFitSettings(tk.Frame):
             self.curve_file_path_var.set(file_path)
             self.process_csv_file(file_path)
 
+    def _read_csv_rows(self, file_path):
+        """Row-by-row fallback for files with headers or ragged/invalid rows."""
+        data_points = []
+        with open(file_path, 'r') as file:
+            csv_reader = csv.reader(file)
+            for row in csv_reader:
+                try:
+                    x, y = map(float, row)
+                    data_points.append([x, y])
+                except ValueError:
+                    print(f"Skipping row: {row} - Invalid data format")
+                    continue
+                if len(data_points) >= _MAX_CURVE_ROWS:
+                    print(f"Curve file truncated to the first {_MAX_CURVE_ROWS} rows")
+                    break
+        return data_points
+
+    def _load_curve_array(self, file_path):
+        """
+        Parse a clean two-column numeric file chunk by chunk, stopping at
+        _MAX_CURVE_ROWS. Returns None when the file needs the row-by-row fallback.
+        """
+        chunks = []
+        total = 0
+        with open(file_path, 'r') as file:
+            # Probe the head first so files with a header or text rows skip
+            # straight to the fallback instead of buffering a whole chunk
+            head = file.readlines(_CSV_PROBE_BYTES)
+            try:
+                probe = np.loadtxt(head, delimiter=",", dtype=np.float64, comments="#", ndmin=2, max_rows=10)
+            except ValueError:
+                return None
+            if probe.size and probe.shape[1] != 2:
+                return None
+            file.seek(0)
+            while total < _MAX_CURVE_ROWS:
+                lines = list(itertools.islice(file, min(_CSV_CHUNK_ROWS, _MAX_CURVE_ROWS - total)))
+                if not lines:
+                    break
+                try:
+                    chunk = np.loadtxt(lines, delimiter=",", dtype=np.float64, comments="#", ndmin=2)
+                except ValueError:
+                    return None
+                if chunk.size == 0:
+                    continue  # only blank/comment lines in this chunk
+                if chunk.shape[1] != 2:
+                    return None
+                chunks.append(chunk)
+                total += len(chunk)
+            if total >= _MAX_CURVE_ROWS and file.readline():
+                print(f"Curve file truncated to the first {_MAX_CURVE_ROWS} rows")
+        if not chunks:
+            return None
+        return np.concatenate(chunks, axis=0)
+
     def process_csv_file(self, file_path):
         try:
-            data_points = []
-            with open(file_path, 'r') as file:
-                csv_reader = csv.reader(file)
-                for row in csv_reader:
-                    try:
-                        x, y = map(float, row)
-                        data_points.append([x, y])
-                    except ValueError:
-                        print(f"Skipping row: {row} - Invalid data format")
-                        continue 
+            # Fast path: clean two-column numeric files are parsed in C by numpy
+            data = self._load_curve_array(file_path)
+            if data is not None:
+                data_points = data
+            else:
+                data_points = self._read_csv_rows(file_path)
             self.controller.update_app_data("generated_data", data_points)
-            if self.inputs_completed_callback:
-                self.inputs_completed_callback("function_button_pressed", True)
+            self._emit("function_button_pressed", True)
         except FileNotFoundError:
             print("File not found.")
         except Exception as e:
@@ -658,11 +810,7 @@ class CurveFitSettings(tk.Frame):
                     self.inputs_completed_callback("noise_output_node", node_name)
 
     def on_ac_response_selected(self, event=None):
-        selected_label = self.ac_response_var.get()
-        for value, label in self.ac_response_options.items():
-            if label == selected_label:
-                self.ac_response = value
-                break
+        self.ac_response = self._ac_response_by_label.get(self.ac_response_var.get(), self.ac_response)
         self._update_ac_response_labels()
         if self.inputs_completed_callback:
             self.inputs_completed_callback("ac_response_changed", self.ac_response)
@@ -692,18 +840,18 @@ class CurveFitSettings(tk.Frame):
             self.x_parameter_var.set("FREQ")
             self.x_param_label.config(text="X Parameter: FREQ")
             self.ac_response_var.set(self.ac_response_options.get(self.ac_response, "Magnitude"))
-            self.ac_response_frame.pack(side=tk.LEFT)
+            self._show_ac_response(True)
             self._update_ac_response_labels()
         elif self.analysis_type == "noise":
             self.x_parameter_var.set("FREQ")
             self.x_param_label.config(text="X Parameter: FREQ")
             self.y_param_label.config(text="Noise Output Node (Y Parameter):")
-            self.ac_response_frame.pack_forget()
+            self._show_ac_response(False)
         else:
             self.x_parameter_var.set("TIME")
             self.x_param_label.config(text="X Parameter: TIME")
             self.y_param_label.config(text="Y Parameter:")
-            self.ac_response_frame.pack_forget()
+            self._show_ac_response(False)
 
     def _format_y_parameter_for_analysis(self, value: str) -> str:
         if not value:
@@ -711,19 +859,12 @@ class CurveFitSettings(tk.Frame):
         token = value.strip()
         if self.analysis_type == "ac":
             lowered = token.lower()
-            if lowered.startswith(("vm(", "vp(", "vr(", "vi(")):
+            if lowered.startswith(_AC_PREFIXES):
                 return token.upper()
-            match = re.match(r"v\s*\((.+)\)", token, flags=re.IGNORECASE)
+            match = _V_RE.match(token)
             if match:
                 inner = match.group(1).strip().upper()
-                prefix = "VM"
-                if self.ac_response == "phase":
-                    prefix = "VP"
-                elif self.ac_response == "real":
-                    prefix = "VR"
-                elif self.ac_response == "imag":
-                    prefix = "VI"
-                # For magnitude_db we still request VM and convert later
+                prefix = _AC_RESPONSE_PREFIX.get(self.ac_response, "VM")
                 return f"{prefix}({inner})"
         return token.upper()
 
@@ -731,7 +872,7 @@ class CurveFitSettings(tk.Frame):
         if not expression:
             return ""
         token = expression.strip()
-        match = re.match(r"v\s*\((.+)\)", token, flags=re.IGNORECASE)
+        match = _V_RE.match(token)
         if match:
             return match.group(1).strip()
         return token
@@ -767,13 +908,7 @@ class CurveFitSettings(tk.Frame):
         elif self.analysis_type == "noise":
             noise_conf = self.current_noise_settings or self.controller.get_app_data("noise_settings") or {}
             quantity = (noise_conf.get("quantity") or "onoise").lower()
-            quantity_labels = {
-                "onoise": ("Output noise", "V/√Hz"),
-                "onoise_db": ("Output noise", "dB/√Hz"),
-                "inoise": ("Input-referred noise", "V/√Hz"),
-                "inoise_db": ("Input-referred noise", "dB/√Hz"),
-            }
-            label_text, unit_text = quantity_labels.get(quantity, quantity_labels["onoise"])
+            label_text, unit_text = _NOISE_QUANTITY_UNITS.get(quantity, _NOISE_QUANTITY_UNITS["onoise"])
             y_units = f"{label_text} ({unit_text})"
             y_display_label = y_display or y_units
             output_node = self._extract_node_name(y_display) or noise_conf.get("output_node", "")
@@ -818,7 +953,7 @@ class CurveFitSettings(tk.Frame):
             messagebox.showerror("Constraint", "Please enter numeric Right/From/To.")
             return
 
-        if not left or op not in {"=", ">=", "<="}:
+        if not left or op not in _CONSTRAINT_OPS:
             messagebox.showerror("Constraint", "Choose Left and an operator (=, >=, <=).")
             return
         if x_min >= x_max:
@@ -844,10 +979,15 @@ class CurveFitSettings(tk.Frame):
         Build the 'Left' dropdown options to mirror your Add Constraint dialog.
         - Components/params: self.parameters (e.g., ['R1', 'C1', ...])
         - Node voltages: V(node) for each node
+        The list is cached and only rebuilt when nodes/parameters change.
         """
-        node_vs = [f"V({node})" for node in self.nodes]
-        # If your dialog uses a specific ordering, adjust here
-        return list(self.parameters) + node_vs
+        key = (tuple(self.nodes), tuple(self.parameters))
+        if key != self._left_options_key:
+            node_vs = [f"V({node})" for node in self.nodes]
+            # If your dialog uses a specific ordering, adjust here
+            self._left_options_cache = list(self.parameters) + node_vs
+            self._left_options_key = key
+        return self._left_options_cache
 
     def _current_axis_labels(self):
         """
@@ -1,7 +1,8 @@
+import functools
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Dict, Optional
-from .expression_evaluator import ExpressionEvaluator
+from typing import Callable, List, Dict, Optional
+from .expression_evaluator import evaluator_for
 from ..ui_theme import (
     COLORS,
     FONTS,
@@ -12,6 +13,12 @@ from ..ui_theme import (
 )
 
 
+@functools.lru_cache(maxsize=256)
+def _validate_cached(params_key: frozenset, nodes_key: frozenset, expression: str) -> bool:
+    is_valid_expr, _ = evaluator_for(params_key, nodes_key).validate_expression(expression)
+    return is_valid_expr
+
+
 class EditConstraintDialog(tk.Toplevel):
     def __init__(
         self,
@@ -21,6 +28,7 @@ class EditConstraintDialog(tk.Toplevel):
         constraint: Dict[str, str],
         allowed_left_items: List[str],
         preview_callback=None,
+        on_done: Optional[Callable[[Dict[str, str]], None]] = None,
     ):
         
         super().__init__(parent)
@@ -33,10 +41,12 @@ class EditConstraintDialog(tk.Toplevel):
         self.all_allowed_vars_display = parameters + node_expressions
         self.constraint: Optional[Dict[str, str]] = constraint
         self.preview_callback = preview_callback
-        # Instantiate evaluator with separate lists
-        self.evaluator = ExpressionEvaluator(
-            parameters=parameters, node_expressions=node_expressions
-        )
+        self.on_done = on_done  # called with the saved constraint; not called on cancel
+        # Evaluators and validation results are shared across dialogs with the same terms
+        self._params_key = frozenset(parameters)
+        self._nodes_key = frozenset(node_expressions)
+        self._allowed_left_set = self._params_key | self._nodes_key
+        self.evaluator = evaluator_for(self._params_key, self._nodes_key)
 
         container = create_card(self)
         container.pack(fill=tk.BOTH, expand=True, padx=24, pady=24)
@@ -90,14 +100,6 @@ class EditConstraintDialog(tk.Toplevel):
                 operator_frame, text=op, variable=self.operator_var, value=op
             ).pack(anchor="w", pady=(4, 0))
 
-        # --- Right Expression/Value ---
-        right_frame = ttk.Frame(self)
-        right_frame.pack(side=tk.LEFT, padx=5, pady=5)
-        right_label = ttk.Label(right_frame, text="Right:")
-        right_label.pack()
-        self.right_var = tk.StringVar(value=constraint.get("right", ""))
-        ttk.Entry(right_frame, textvariable=self.right_var, width=15).pack(side=tk.LEFT)
-
         # --- X-Window (optional) ---
         xwin_frame = ttk.Frame(self)
         xwin_frame.pack(side=tk.LEFT, padx=10, pady=5)
@@ -109,6 +111,8 @@ class EditConstraintDialog(tk.Toplevel):
         ttk.Label(xwin_frame, text="To x:").grid(row=1, column=0, sticky="w")
         self.xmax_var = tk.StringVar(value="" if constraint.get("x_max") is None else str(constraint.get("x_max")))
         ttk.Entry(xwin_frame, textvariable=self.xmax_var, width=10).grid(row=1, column=1, padx=(4, 10))
+
+        # --- Right Expression/Value ---
         right_frame = tk.Frame(body, bg=COLORS["bg_secondary"])
         right_frame.grid(row=0, column=2, sticky="nsew", padx=(12, 0))
         tk.Label(
@@ -118,7 +122,7 @@ class EditConstraintDialog(tk.Toplevel):
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
         ).pack(anchor="w")
-        self.right_var = tk.StringVar(value=constraint["right"])
+        self.right_var = tk.StringVar(value=constraint.get("right", ""))
         ttk.Entry(right_frame, textvariable=self.right_var, width=22).pack(
             fill=tk.X, pady=(6, 0)
         )
@@ -136,12 +140,6 @@ class EditConstraintDialog(tk.Toplevel):
             if constraint_snapshot:
                 self.preview_callback(constraint_snapshot)
 
-        # --- OK / Cancel ---
-        button_frame = ttk.Frame(self)
-        button_frame.pack(pady=10)
-        ttk.Button(button_frame, text="OK", command=self.on_ok).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Cancel", command=self.on_cancel).pack(side=tk.LEFT, padx=5)
-
         # --- OK and Cancel Buttons ---
         button_frame = tk.Frame(body, bg=COLORS["bg_secondary"])
         button_frame.grid(row=1, column=0, columnspan=3, pady=(18, 0), sticky=tk.E)
@@ -167,7 +165,7 @@ class EditConstraintDialog(tk.Toplevel):
             return
 
         # left still must be a single, allowed item
-        if left not in (self.parameters + self.node_expressions):
+        if left not in self._allowed_left_set:
             messagebox.showerror("Validation Error", f"Invalid left-hand side: '{left}'.", parent=self)
             return
 
@@ -195,29 +193,32 @@ class EditConstraintDialog(tk.Toplevel):
         self.constraint["x_max"] = xmax
 
         self.destroy()
+        if self.on_done is not None:
+            self.on_done(self.constraint)
         
     def on_cancel(self):
         # Don't change the constraint
         self.destroy()
 
     def is_valid_input(self, input_str: str) -> bool:
-        """Validates the right-hand side string as either a valid expression or a number."""
-        # 1. Try to validate as an expression using the evaluator
-        is_valid_expr, used_vars = self.evaluator.validate_expression(input_str)
-
-        if is_valid_expr:
-            # --- REMOVED REDUNDANT LOOP ---
-            # If validate_expression returned True, the variables used are already confirmed
-            # to be within the evaluator's allowed set (parameters + mangled nodes).
-            return True  # It's a valid expression
-
-        # 2. If not a valid expression, check if it's a valid number
+        """Validates the right-hand side string as either a number or a valid expression."""
+        # 1. Numbers are by far the common case; check them before parsing an expression
         try:
             # TODO: Enhance to handle SI units like '1k', '0.1u' if desired
             float(input_str)
             return True  # It's a valid number
         except ValueError:
-            # If it's neither a valid expression nor a valid number
+            pass
+
+        # 2. Otherwise validate as an expression using the evaluator
+        is_valid_expr = _validate_cached(self._params_key, self._nodes_key, input_str)
+
+        if is_valid_expr:
+            # If validate_expression returned True, the variables used are already confirmed
+            # to be within the evaluator's allowed set (parameters + mangled nodes).
+            return True  # It's a valid expression
+        else:
+            # If it's neither a valid number nor a valid expression
             messagebox.showerror(
                 "Validation Error",
                 f"Invalid right-hand side: '{input_str}'.\nMust be a valid number or expression using allowed terms.",
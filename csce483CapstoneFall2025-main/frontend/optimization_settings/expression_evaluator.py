@@ -1,5 +1,6 @@
 # frontend/optimization_settings/expression_evaluator.py
 import ast
+import functools
 import math
 import re
 from typing import Dict, Any, List, Tuple
@@ -65,6 +66,9 @@ class ExpressionEvaluator:
 
         # Combine original parameters and mangled node names for validation checks
         self.allowed_mangled_vars = self.original_parameters + self.mangled_node_vars
+        # Set views of the lists above for the per-name membership checks
+        self._parameter_set = frozenset(self.original_parameters)
+        self._allowed_mangled_set = frozenset(self.allowed_mangled_vars)
 
         # Combine everything allowed in expressions
         self.full_allowed_symbols = set(self._allowed_funcs.keys()) | set(
@@ -104,7 +108,7 @@ class ExpressionEvaluator:
             re.findall(r"[a-zA-Z_][a-zA-Z0-9_]*", processed_expression)
         )
         for var in potential_vars:
-            if var in self.original_parameters and var not in original_names_found:
+            if var in self._parameter_set and var not in original_names_found:
                 original_names_found.append(var)
 
         return processed_expression, original_names_found
@@ -146,7 +150,7 @@ class ExpressionEvaluator:
                     # Check if the (potentially mangled) name is allowed
                     if node.id not in self.full_allowed_symbols:
                         return False, []  # Disallowed variable or function name
-                    if node.id in self.allowed_mangled_vars:
+                    if node.id in self._allowed_mangled_set:
                         actual_mangled_vars_used.add(node.id)  # Track used vars/nodes
                 elif isinstance(node, ast.Call):
                     # Check if it's an allowed function call
@@ -187,7 +191,7 @@ class ExpressionEvaluator:
             for mangled_var in actual_mangled_vars_used:
                 if mangled_var in self.mangled_node_map:
                     original_vars_used.append(self.mangled_node_map[mangled_var])
-                elif mangled_var in self.original_parameters:
+                elif mangled_var in self._parameter_set:
                     original_vars_used.append(mangled_var)
                 # Else: Should be an allowed func like pi/e, ignore here.
 
@@ -200,3 +204,11 @@ class ExpressionEvaluator:
         except Exception as e:  # Catch other potential errors during validation
             print(f"Unexpected validation error: {e}")
             return False, []
+
+
+@functools.lru_cache(maxsize=32)
+def evaluator_for(params_key: frozenset, nodes_key: frozenset) -> ExpressionEvaluator:
+    """One evaluator (and its mangled-name tables) per distinct parameter/node set."""
+    return ExpressionEvaluator(
+        parameters=sorted(params_key), node_expressions=sorted(nodes_key)
+    )
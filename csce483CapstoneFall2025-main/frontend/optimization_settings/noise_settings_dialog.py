@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 from typing import Iterable, Optional
 
 from ..ui_theme import (
@@ -12,6 +12,21 @@ from ..ui_theme import (
 )
 
 
+# (label, field kind, padx) for each row of the dialog, top to bottom
+_FIELDS = (
+    ("Measure noise at node", "output", (0, 10)),
+    ("Noise quantity", "quantity", (0, 10)),
+    ("Driven by source", "source", (0, 10)),
+    ("Sweep type", "sweep", 0),
+    ("Points per interval", "points", 0),
+    ("Start frequency (Hz)", "start", 0),
+    ("Stop frequency (Hz)", "stop", 0),
+)
+
+
+_MIN_FREQ_DIFF = 1e-9
+
+
 class NoiseSettingsDialog(tk.Toplevel):
     """Lightweight dialog for configuring noise sweeps."""
 
@@ -21,6 +36,9 @@ class NoiseSettingsDialog(tk.Toplevel):
         "inoise": "Input-referred noise density (V/√Hz)",
         "inoise_db": "Input-referred noise density (dB/√Hz)",
     }
+    _LABEL_TO_KEY = {label: key for key, label in QUANTITY_OPTIONS.items()}
+    _VALID_SWEEPS = frozenset(("DEC", "LIN", "OCT"))
+    _SWEEP_CHOICES = sorted(_VALID_SWEEPS)
 
     def __init__(
         self,
@@ -30,20 +48,20 @@ class NoiseSettingsDialog(tk.Toplevel):
         initial_settings: Optional[dict],
     ) -> None:
         super().__init__(parent)
+        # Stay hidden until fully built so Tk paints the finished dialog once
+        self.withdraw()
         apply_modern_theme(self)
         self.configure(bg=COLORS["bg_primary"])
         self.title("Noise Analysis Settings")
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
         self.result: Optional[dict] = None
 
-        normalized_nodes = sorted(
-            [node for node in (nodes or []) if node and str(node).strip()],
-            key=lambda token: str(token).lower(),
+        # Ground node (0) is implicit for single-ended voltages; drop it in the same pass
+        self.available_nodes = sorted(
+            [name for node in nodes or () if node and (name := str(node)).strip() not in ("", "0")],
+            key=str.lower,
         )
-        # Ground node (0) is implicit for single-ended voltages
-        self.available_nodes = [node for node in normalized_nodes if str(node).strip() != "0"]
         self.available_sources = list(sources or [])
 
         settings = initial_settings or {}
@@ -58,7 +76,11 @@ class NoiseSettingsDialog(tk.Toplevel):
         self.stop_var = tk.StringVar(value=str(settings.get("stop_frequency", 1_000_000.0)))
 
         self._build_ui()
+        self.update_idletasks()
+        self.deiconify()
         self.wait_visibility()
+        # A grab needs a viewable window, so it is taken after deiconify
+        self.grab_set()
         self.focus_set()
 
     def _build_ui(self) -> None:
@@ -66,120 +88,105 @@ class NoiseSettingsDialog(tk.Toplevel):
         container.pack(fill=tk.BOTH, expand=True, padx=24, pady=24)
         body = container.inner
 
-        # Output node + quantity selectors
-        tk.Label(
-            body,
-            text="Measure noise at node",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=0, column=0, sticky=tk.W, pady=6)
-        self.output_dropdown = ttk.Combobox(
-            body,
-            textvariable=self.output_node_var,
-            values=self.available_nodes,
-            state="readonly" if self.available_nodes else "disabled",
-            width=20,
-        )
-        self.output_dropdown.grid(row=0, column=1, sticky=tk.W, pady=6, padx=(0, 10))
-
-        tk.Label(
-            body,
-            text="Noise quantity",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=1, column=0, sticky=tk.W, pady=6)
-        self.quantity_dropdown = ttk.Combobox(
-            body,
-            textvariable=self.quantity_var,
-            values=list(self.QUANTITY_OPTIONS.values()),
-            state="readonly",
-            width=32,
-        )
-        self.quantity_dropdown.grid(row=1, column=1, sticky=tk.W, pady=6, padx=(0, 10))
-
-        tk.Label(
-            body,
-            text="Driven by source",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=2, column=0, sticky=tk.W, pady=6)
-        self.source_dropdown = ttk.Combobox(
-            body,
-            textvariable=self.input_source_var,
-            values=self.available_sources,
-            state="readonly" if self.available_sources else "disabled",
-            width=20,
+        # Widgets are created first and gridded together in _flush_layout
+        self._pending_layout = []
+        font_body, bg, fg = FONTS["body"], COLORS["bg_secondary"], COLORS["text_primary"]
+        label_kwargs = {"font": font_body, "bg": bg, "fg": fg}
+        self._input_widgets = []
+        for row, (text, kind, padx) in enumerate(_FIELDS):
+            self._pending_layout.append(
+                (tk.Label(body, text=text, **label_kwargs), {"row": row, "column": 0, "sticky": tk.W, "pady": 6})
+            )
+            field = self._make_field(body, kind)
+            self._input_widgets.append(field)
+            self._pending_layout.append(
+                (field, {"row": row, "column": 1, "sticky": tk.W, "pady": 6, "padx": padx})
+            )
+
+        for widget in self._input_widgets:
+            widget.bind("<Return>", self._on_save_event)
+
+        buttons = tk.Frame(body, bg=bg)
+        self._pending_layout.append(
+            (buttons, {"row": len(_FIELDS), "column": 0, "columnspan": 2, "pady": (16, 0), "sticky": tk.E})
         )
-        self.source_dropdown.grid(row=2, column=1, sticky=tk.W, pady=6, padx=(0, 10))
-
-        # Sweep controls
-        tk.Label(
-            body,
-            text="Sweep type",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=3, column=0, sticky=tk.W, pady=6)
-        ttk.Combobox(
-            body,
-            textvariable=self.sweep_var,
-            values=["DEC", "LIN", "OCT"],
-            state="readonly",
-            width=12,
-        ).grid(row=3, column=1, sticky=tk.W, pady=6)
-
-        tk.Label(
-            body,
-            text="Points per interval",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=4, column=0, sticky=tk.W, pady=6)
-        ttk.Entry(body, textvariable=self.points_var, width=15).grid(row=4, column=1, sticky=tk.W, pady=6)
-
-        tk.Label(
-            body,
-            text="Start frequency (Hz)",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=5, column=0, sticky=tk.W, pady=6)
-        ttk.Entry(body, textvariable=self.start_var, width=20).grid(row=5, column=1, sticky=tk.W, pady=6)
-
-        tk.Label(
-            body,
-            text="Stop frequency (Hz)",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=6, column=0, sticky=tk.W, pady=6)
-        ttk.Entry(body, textvariable=self.stop_var, width=20).grid(row=6, column=1, sticky=tk.W, pady=6)
-
-        for child in body.winfo_children():
-            if isinstance(child, ttk.Entry) or isinstance(child, ttk.Combobox):
-                child.bind("<Return>", lambda _: self._on_save())
-
-        buttons = tk.Frame(body, bg=COLORS["bg_secondary"])
-        buttons.grid(row=7, column=0, columnspan=2, pady=(16, 0), sticky=tk.E)
         create_secondary_button(buttons, text="Cancel", command=self._on_cancel).pack(side=tk.RIGHT, padx=(0, 10))
         create_primary_button(buttons, text="Save", command=self._on_save).pack(side=tk.RIGHT)
 
         if not self.available_sources:
-            tk.Label(
+            warning = tk.Label(
                 body,
                 text="No independent voltage or current sources detected in the top-level netlist. "
                 "Add a source before running noise analysis.",
                 font=FONTS["caption"],
                 wraplength=360,
                 justify=tk.LEFT,
-                bg=COLORS["bg_secondary"],
+                bg=bg,
                 fg=COLORS["warning"],
-            ).grid(row=8, column=0, columnspan=2, pady=(10, 0), sticky=tk.W)
+            )
+            self._pending_layout.append(
+                (warning, {"row": len(_FIELDS) + 1, "column": 0, "columnspan": 2, "pady": (10, 0), "sticky": tk.W})
+            )
+
+        self._flush_layout()
+
+    def _flush_layout(self) -> None:
+        """Grid every widget queued by _build_ui in one batch."""
+        for widget, grid_kwargs in self._pending_layout:
+            widget.grid(**grid_kwargs)
+        self._pending_layout = []
+
+    @staticmethod
+    def _make_choice_menu(body: tk.Misc, variable: tk.StringVar, choices, width: int) -> ttk.Menubutton:
+        """Menubutton + radiobutton menu for short fixed lists (lighter than a Combobox)."""
+        button = ttk.Menubutton(body, textvariable=variable, width=width)
+        menu = tk.Menu(button, tearoff=0)
+        for choice in choices:
+            menu.add_radiobutton(label=choice, variable=variable, value=choice)
+        button["menu"] = menu
+        return button
+
+    def _make_field(self, body: tk.Misc, kind: str) -> tk.Widget:
+        """Create the input widget for one row of _FIELDS."""
+        if kind == "output":
+            self.output_dropdown = ttk.Combobox(
+                body,
+                textvariable=self.output_node_var,
+                values=self.available_nodes,
+                state="readonly" if self.available_nodes else "disabled",
+                width=20,
+            )
+            return self.output_dropdown
+        if kind == "quantity":
+            self.quantity_dropdown = self._make_choice_menu(
+                body, self.quantity_var, self.QUANTITY_OPTIONS.values(), width=32
+            )
+            return self.quantity_dropdown
+        if kind == "source":
+            self.source_dropdown = ttk.Combobox(
+                body,
+                textvariable=self.input_source_var,
+                values=self.available_sources,
+                state="readonly" if self.available_sources else "disabled",
+                width=20,
+            )
+            return self.source_dropdown
+        if kind == "sweep":
+            return self._make_choice_menu(body, self.sweep_var, self._SWEEP_CHOICES, width=12)
+        var, width = {
+            "points": (self.points_var, 15),
+            "start": (self.start_var, 20),
+            "stop": (self.stop_var, 20),
+        }[kind]
+        return ttk.Entry(body, textvariable=var, width=width)
+
+    def _on_save_event(self, _event=None) -> None:
+        self._on_save()
 
     def _on_save(self) -> None:
+        # Only the error paths need it; deferred so opening the dialog doesn't load it
+        from tkinter import messagebox
+
         if not self.available_nodes:
             messagebox.showerror("Missing Node", "No top-level nodes found for noise measurement.")
             return
@@ -196,10 +203,15 @@ class NoiseSettingsDialog(tk.Toplevel):
             messagebox.showerror("Invalid Source", "Select the driving source for noise analysis.")
             return
 
+        # One Tcl read per field; blank fields are rejected before any float() is attempted
+        pv, sv, tv = self.points_var.get(), self.start_var.get(), self.stop_var.get()
+        if not (pv.strip() and sv.strip() and tv.strip()):
+            messagebox.showerror("Invalid Sweep", "Provide numeric values for noise sweep points and frequencies.")
+            return
         try:
-            points = int(float(self.points_var.get()))
-            start_freq = float(self.start_var.get())
-            stop_freq = float(self.stop_var.get())
+            points = int(float(pv))
+            start_freq = float(sv)
+            stop_freq = float(tv)
         except ValueError:
             messagebox.showerror("Invalid Sweep", "Provide numeric values for noise sweep points and frequencies.")
             return
@@ -210,27 +222,22 @@ class NoiseSettingsDialog(tk.Toplevel):
         if start_freq <= 0 or stop_freq <= 0:
             messagebox.showerror("Invalid Sweep", "Frequencies must be greater than zero.")
             return
-        if stop_freq <= start_freq:
-            messagebox.showerror("Invalid Sweep", "Stop frequency must be greater than start frequency.")
-            return
-        # Ensure the frequency range is not too small
-        MIN_FREQ_DIFF = 1e-9
-        if (stop_freq - start_freq) < MIN_FREQ_DIFF:
+        # One test covers both an inverted range and one that is too narrow
+        if stop_freq - start_freq < _MIN_FREQ_DIFF:
             messagebox.showerror(
                 "Invalid Sweep",
-                f"Stop frequency and start frequency are too close. Please ensure they differ by at least {MIN_FREQ_DIFF}."
+                f"Stop frequency must exceed start frequency by at least {_MIN_FREQ_DIFF} Hz.",
             )
             return
 
-        sweep = (self.sweep_var.get() or "DEC").upper()
-        if sweep not in {"DEC", "LIN", "OCT"}:
-            sweep = "DEC"
+        # The menu only offers valid (uppercase) values, so upper() is rarely needed
+        sweep = self.sweep_var.get() or "DEC"
+        if sweep not in self._VALID_SWEEPS:
+            sweep = sweep.upper()
+            if sweep not in self._VALID_SWEEPS:
+                sweep = "DEC"
 
-        quantity_label = self.quantity_var.get()
-        quantity_key = next(
-            (key for key, label in self.QUANTITY_OPTIONS.items() if label == quantity_label),
-            "onoise",
-        )
+        quantity_key = self._LABEL_TO_KEY.get(self.quantity_var.get(), "onoise")
 
         self.result = {
             "output_node": node,
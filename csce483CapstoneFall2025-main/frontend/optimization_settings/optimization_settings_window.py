@@ -1,14 +1,20 @@
+import queue
+import threading as th
 import tkinter as tk
 
 from tkinter import ttk, messagebox
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from .add_constraint_dialog import AddConstraintDialog
-from .edit_constraint_dialog import EditConstraintDialog
 from .constraint_table import ConstraintTable
 from .curve_fit_settings import CurveFitSettings
 from .ac_settings_dialog import AcSettingsDialog
 from .noise_settings_dialog import NoiseSettingsDialog
-from ..utils import import_constraints_from_file, export_constraints_to_file
+from .expression_evaluator import ExpressionEvaluator, evaluator_for
+from ..utils import (
+    ask_constraints_file_path,
+    load_constraints_file,
+    export_constraints_to_file,
+)
 from ..ui_theme import (
     COLORS,
     FONTS,
@@ -17,20 +23,114 @@ from ..ui_theme import (
     create_card,
 )
 
+_WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")  # Windows/macOS, X11 up/down
+_SCROLL_DEBOUNCE_MS = 50  # trailing delay for <Configure> bursts during a resize
+_WHEEL_FLUSH_MS = 16  # roughly one frame; wheel/touchpad bursts inside it scroll once
+_IMPORT_CHUNK_SIZE = 250  # constraints handed to the table per event-loop tick
+_IMPORT_POLL_MS = 30
+_ANALYSIS_LABELS = {"transient": "Transient", "ac": "AC", "noise": "Noise"}
+_AC_RESPONSE_LABELS = {
+    "magnitude": "Magnitude",
+    "magnitude_db": "Magnitude (dB)",
+    "phase": "Phase",
+    "real": "Real",
+    "imag": "Imag",
+}
+_NOISE_QUANTITY_LABELS = {
+    "onoise": "Output noise (V/√Hz)",
+    "onoise_db": "Output noise (dB/√Hz)",
+    "inoise": "Input-referred noise (V/√Hz)",
+    "inoise_db": "Input-referred noise (dB/√Hz)",
+}
+_NOISE_QUANTITIES = frozenset(_NOISE_QUANTITY_LABELS)
 
-class OptimizationSettingsWindow(tk.Frame):
-    def validate_float(self, var_name):
-        try:
-            val = float(getattr(self, var_name).get())
-            return True
-        except ValueError:
-            messagebox.showerror(
-                "Invalid Input",
-                f"Please enter a valid number for {var_name.replace('_var', '')}",
-            )
-            getattr(self, var_name).set("1e-12")  # Reset to default if invalid
-            return False
 
+
+def _as_float(value, default):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_int(value, default):
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _as_str(value, default=""):
+    if value is None:
+        return default
+    text = str(value).strip()
+    return text if text else default
+
+
+def _as_upper(value, default):
+    return str(value).upper()
+
+
+def _as_lower(value, default):
+    return str(value).lower()
+
+
+def _as_bool(value, default):
+    return bool(value)
+
+
+# (key, coercer, default) for each stored analysis-settings dict
+_AC_SCHEMA = (
+    ("sweep_type", _as_upper, "DEC"),
+    ("points", _as_int, 10),
+    ("start_frequency", _as_float, 1.0),
+    ("stop_frequency", _as_float, 1_000_000.0),
+    ("response", _as_lower, "magnitude"),
+)
+_NOISE_SCHEMA = (
+    ("sweep_type", _as_upper, "DEC"),
+    ("points", _as_int, 10),
+    ("start_frequency", _as_float, 1.0),
+    ("stop_frequency", _as_float, 1_000_000.0),
+    ("output_node", _as_str, ""),
+    ("input_source", _as_str, ""),
+    ("quantity", _as_lower, "onoise"),
+)
+_TRAN_SCHEMA = (
+    ("tstop", _as_float, None),
+    ("tstep", _as_float, None),
+    ("tstart", _as_float, None),
+    ("max_step", _as_float, None),
+    ("uic", _as_bool, False),
+)
+
+
+# Formatted sweep summaries keyed by the settings that produced them (FIFO-bounded)
+_SUMMARY_CACHE: Dict[Tuple[str, Tuple[Any, ...]], str] = {}
+_SUMMARY_CACHE_SIZE = 32
+
+
+def _remember_summary(key: Tuple[str, Tuple[Any, ...]], summary: str) -> None:
+    if len(_SUMMARY_CACHE) >= _SUMMARY_CACHE_SIZE:
+        del _SUMMARY_CACHE[next(iter(_SUMMARY_CACHE))]
+    _SUMMARY_CACHE[key] = summary
+
+
+def _parse_optional(var: tk.StringVar, label: str) -> Tuple[Optional[float], Optional[str]]:
+    raw = (var.get() or "").strip()
+    if not raw:
+        return None, None
+    try:
+        return float(raw), None
+    except ValueError:
+        return None, label
+
+
+def _coerce(stored: Dict[str, Any], schema) -> Dict[str, Any]:
+    return {key: fn(stored.get(key, default), default) for key, fn, default in schema}
+
+
+class OptimizationSettingsWindow(tk.Frame):
     def __init__(self, parent: tk.Tk, controller: "AppController"):
         super().__init__(parent, bg=COLORS["bg_primary"])
         self.controller = controller  # Assign controller first
@@ -40,6 +140,8 @@ class OptimizationSettingsWindow(tk.Frame):
             self.controller.get_app_data("selected_parameters") or []
         )  # Ensure it's a list
         self.nodes = self.controller.get_app_data("nodes") or []  # Ensure it's a list
+        # Nodes are fixed for the life of this window, so sort them once for the noise dialog
+        self._sorted_nodes = sorted(self.nodes)
 
         stored_analysis_type = (
             self.controller.get_app_data("analysis_type") or "transient"
@@ -48,83 +150,98 @@ class OptimizationSettingsWindow(tk.Frame):
         stored_tran_settings = self.controller.get_app_data("tran_settings") or {}
         stored_noise_settings = self.controller.get_app_data("noise_settings") or {}
         self.source_names = list(self.controller.get_app_data("source_names") or [])
-        def _as_float(value, default):
-            try:
-                return float(value)
-            except (TypeError, ValueError):
-                return default
 
-        def _as_int(value, default):
-            try:
-                return int(float(value))
-            except (TypeError, ValueError):
-                return default
-
-        def _as_str(value, default=""):
-            if value is None:
-                return default
-            text = str(value).strip()
-            return text if text else default
-
-        if stored_analysis_type == "ac":
-            self.analysis_type = "ac"
-        elif stored_analysis_type == "noise":
-            self.analysis_type = "noise"
-        else:
-            self.analysis_type = "transient"
-        self.ac_settings = {
-            "sweep_type": str(stored_ac_settings.get("sweep_type", "DEC")).upper(),
-            "points": _as_int(stored_ac_settings.get("points"), 10),
-            "start_frequency": _as_float(stored_ac_settings.get("start_frequency"), 1.0),
-            "stop_frequency": _as_float(stored_ac_settings.get("stop_frequency"), 1_000_000.0),
-            "response": str(stored_ac_settings.get("response", "magnitude")).lower(),
-        }
-        self.noise_settings = {
-            "sweep_type": str(stored_noise_settings.get("sweep_type", "DEC")).upper(),
-            "points": _as_int(stored_noise_settings.get("points"), 10),
-            "start_frequency": _as_float(stored_noise_settings.get("start_frequency"), 1.0),
-            "stop_frequency": _as_float(stored_noise_settings.get("stop_frequency"), 1_000_000.0),
-            "output_node": _as_str(stored_noise_settings.get("output_node")),
-            "input_source": _as_str(stored_noise_settings.get("input_source")),
-            "quantity": str(stored_noise_settings.get("quantity", "onoise")).lower(),
-        }
-        if self.noise_settings["quantity"] not in {"onoise", "onoise_db", "inoise", "inoise_db"}:
+        if stored_analysis_type not in _ANALYSIS_LABELS:
+            stored_analysis_type = "transient"
+        self.analysis_type = stored_analysis_type
+        self.ac_settings = _coerce(stored_ac_settings, _AC_SCHEMA)
+        self.noise_settings = _coerce(stored_noise_settings, _NOISE_SCHEMA)
+        if self.noise_settings["quantity"] not in _NOISE_QUANTITIES:
             self.noise_settings["quantity"] = "onoise"
 
-        self.tran_settings = {
-            "tstop": _as_float(stored_tran_settings.get("tstop"), None),
-            "tstep": _as_float(stored_tran_settings.get("tstep"), None),
-            "tstart": _as_float(stored_tran_settings.get("tstart"), None),
-            "max_step": _as_float(stored_tran_settings.get("max_step"), None),
-            "uic": bool(stored_tran_settings.get("uic", False)),
-        }
-
-        # --- Now build the lists ---
-        self.node_voltage_expressions = [
-            f"V({node})" for node in self.nodes if node != "0"
-        ]
+        self.tran_settings = _coerce(stored_tran_settings, _TRAN_SCHEMA)
 
-        # --- NOW it's safe to create the combined list ---
-        self.allowed_constraint_left_sides: List[str] = (
-            self.selected_parameters + self.node_voltage_expressions
-        )
-        deduped = []
-        seen_ct = set()
-        for item in self.allowed_constraint_left_sides:
-            if item in seen_ct:
-                continue
-            seen_ct.add(item)
-            deduped.append(item)
-        self.allowed_constraint_left_sides = sorted(deduped)
+        # --- Now build the lists and the combined lookups ---
+        self._rebuild_name_lookups()
 
         # --- Continue with other initializations ---
         self.constraints: List[Dict[str, str]] = []
-        self.all_allowed_validation_vars = (  # This line should also come after definitions
-            self.selected_parameters + self.node_voltage_expressions
-        )
+        self._last_analysis_type: Optional[str] = None  # last type _update_analysis_ui laid out
+        self._last_ctx: Optional[Tuple[Any, ...]] = None  # last context sent to CurveFitSettings
+        self._import_after: Optional[str] = None  # pending import poll/chunk callback
         self.function_button_pressed = False
         self.y_param_dropdown_selected = False
 
+        # Pending controller writes, pushed once per handler by _flush_app_data
+        self._dirty_app_data: Dict[str, Any] = {
+            "analysis_type": self.analysis_type,
+            "ac_settings": self.ac_settings,
+            "noise_settings": self.noise_settings,
+        }
+        self._flush_app_data()
+        # Content signatures of the settings last written, so unchanged dialog results are skipped
+        self._settings_sig: Dict[str, Tuple[Tuple[str, Any], ...]] = {}
+        self._settings_changed("ac_settings", self.ac_settings)
+        self._settings_changed("noise_settings", self.noise_settings)
+
+        self._build_ui()
+
+    def _rebuild_name_lookups(self) -> None:
+        """(Re)build every lookup derived from selected_parameters and nodes.
+
+        Also drops the constraint-type cache and evaluator, so call this again
+        whenever either source list is reassigned.
+        """
+        self.node_voltage_expressions = [f"V({n})" for n in self.nodes if n != "0"]
+        # name -> "parameter"/"node"; parameters are applied last so they win a name clash
+        self._name_kind: Dict[str, str] = dict.fromkeys(self.node_voltage_expressions, "node")
+        self._name_kind.update(dict.fromkeys(self.selected_parameters, "parameter"))
+        self._name_kind.pop("", None)
+        # Deduplicated and sorted once; handed to both constraint dialogs and
+        # reused as the validation vocabulary
+        self._sorted_names: Tuple[str, ...] = tuple(sorted(self._name_kind))
+        self.allowed_constraint_left_sides = self._sorted_names
+        self.all_allowed_validation_vars = self._sorted_names
+        self._expr_evaluator: Optional[ExpressionEvaluator] = None
+        self._constraint_type_cache: Dict[str, Optional[str]] = {}
+
+    def _set_ctx_if_changed(self) -> None:
+        """Push the analysis context to CurveFitSettings only when it differs from the last push."""
+        ctx = (
+            self.analysis_type,
+            self.ac_settings.get("response", "magnitude"),
+            tuple(sorted(self.noise_settings.items())),
+        )
+        if ctx == self._last_ctx:
+            return
+        self._last_ctx = ctx
+        self.curve_fit_settings.set_analysis_context(
+            self.analysis_type,
+            self.ac_settings.get("response", "magnitude"),
+            noise_settings=self.noise_settings,
+        )
+
+    def _settings_changed(self, key: str, settings: Dict[str, Any]) -> bool:
+        """Record the settings' signature; False when it matches the last one seen."""
+        sig = tuple(sorted(settings.items()))
+        if self._settings_sig.get(key) == sig:
+            return False
+        self._settings_sig[key] = sig
+        return True
+
+    def _flush_app_data(self) -> None:
+        """Writes staged app data to the controller, skipping unchanged values."""
+        pending, self._dirty_app_data = self._dirty_app_data, {}
+        get = self.controller.get_app_data
+        changed = {key: value for key, value in pending.items() if get(key) is not value}
+        if changed:
+            self.controller.update_app_data_bulk(changed)
+
+    def _build_ui(self) -> None:
+        # One registered key validator shared by every numeric entry; it rejects
+        # non-numeric keystrokes in Tk and the strict parse happens on submit
+        self._float_vcmd = (self.register(self._validate_float_key), "%P")
+
         # --- Header ---
         header_card = create_card(self, padding=None)
         header_card.pack(fill=tk.X, padx=32, pady=(24, 16))
@@ -136,12 +253,10 @@ class OptimizationSettingsWindow(tk.Frame):
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
         ).pack(anchor="w", padx=24, pady=(18, 4))
-        tk.Label(
+        ttk.Label(
             header_body,
             text="Review your analysis configuration, adjust curve-fit goals, and manage constraints before running the optimization.",
-            font=FONTS["body"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_secondary"],
+            style="Secondary.TLabel",
             wraplength=720,
             justify=tk.LEFT,
         ).pack(anchor="w", padx=24, pady=(0, 18))
@@ -176,21 +291,30 @@ class OptimizationSettingsWindow(tk.Frame):
 
         scrollable_frame = ttk.Frame(canvas, style="TFrame")
         canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-
-        def _refresh_scrollregion(width_hint: Optional[int] = None):
-            desired_width = max(scrollable_frame.winfo_reqwidth(), width_hint or canvas.winfo_width())
-            canvas.itemconfig(canvas_window, width=desired_width)
-            canvas.configure(scrollregion=canvas.bbox("all"))
-
-        scrollable_frame.bind("<Configure>", lambda event: _refresh_scrollregion())
-        canvas.bind("<Configure>", lambda event: _refresh_scrollregion(event.width))
-
-        def _on_mousewheel(event):
-            if canvas.winfo_exists():
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        canvas.bind("<Enter>", lambda e: scrollable_frame.bind_all("<MouseWheel>", _on_mousewheel))
-        canvas.bind("<Leave>", lambda e: scrollable_frame.unbind_all("<MouseWheel>"))
+        self._canvas = canvas
+        self._canvas_window = canvas_window
+        self._scrollable_frame = scrollable_frame
+
+        # Resize/relayout bursts are debounced into one scrollregion update once
+        # <Configure> events stop arriving; the bbox is only reapplied when it changed
+        self._pending_width: Optional[int] = None
+        self._scroll_after: Optional[str] = None
+        self._last_bbox = None
+        self._last_window_width = None
+        scrollable_frame.bind("<Configure>", lambda event: self._schedule_scroll_update())
+        canvas.bind("<Configure>", lambda event: self._schedule_scroll_update(event.width))
+
+        # Wheel deltas are summed and scrolled once per frame. Bound once for the
+        # whole app (wheel events go to the widget under the pointer, not the canvas);
+        # the handler ignores events outside this canvas. Whatever was bound before
+        # is kept so destroy() can put it back.
+        self._wheel_accum = 0.0
+        self._wheel_pending: Optional[str] = None
+        self._prev_wheel_bindings = {
+            sequence: self.bind_all(sequence) for sequence in _WHEEL_SEQUENCES
+        }
+        for sequence in _WHEEL_SEQUENCES:
+            self.bind_all(sequence, self._on_mousewheel)
         main_frame = scrollable_frame
 
         # --- Optimization Type Dropdown ---
@@ -219,93 +343,38 @@ class OptimizationSettingsWindow(tk.Frame):
         ttk.Label(analysis_type_frame, text="Analysis Type:").pack(
             side=tk.LEFT, anchor=tk.W, pady=5
         )
-        if self.analysis_type == "ac":
-            initial_analysis_label = "AC"
-        elif self.analysis_type == "noise":
-            initial_analysis_label = "Noise"
-        else:
-            initial_analysis_label = "Transient"
-        self.analysis_type_var = tk.StringVar(value=initial_analysis_label)
+        self.analysis_type_var = tk.StringVar(value=_ANALYSIS_LABELS[self.analysis_type])
         analysis_type_dropdown = ttk.Combobox(
             analysis_type_frame,
             textvariable=self.analysis_type_var,
-            values=["Transient", "AC", "Noise"],
+            values=list(_ANALYSIS_LABELS.values()),
             state="readonly",
             width=12,
         )
         analysis_type_dropdown.pack(side=tk.LEFT, anchor=tk.W, padx=(0, 10), pady=5)
         analysis_type_dropdown.bind("<<ComboboxSelected>>", self.on_analysis_type_change)
 
-        self.ac_config_button = create_secondary_button(
-            analysis_type_frame,
-            text="Configure AC Sweep...",
-            command=self.open_ac_settings,
-        )
+        # The per-analysis panels are built on first use by _update_analysis_ui
+        self._analysis_type_frame = analysis_type_frame
+        self._main_frame = main_frame
         self.ac_summary_var = tk.StringVar(value="")
-        self.ac_details_frame = ttk.Frame(main_frame)
-        self.ac_summary_label = ttk.Label(
-            self.ac_details_frame, textvariable=self.ac_summary_var
-        )
-        self.ac_summary_label.pack(side=tk.LEFT, anchor=tk.W, padx=5)
-
-        self.noise_config_button = create_secondary_button(
-            analysis_type_frame,
-            text="Configure Noise Sweep...",
-            command=self.open_noise_settings,
-        )
         self.noise_summary_var = tk.StringVar(value="")
-        self.noise_details_frame = ttk.Frame(main_frame)
-        self.noise_summary_label = ttk.Label(
-            self.noise_details_frame, textvariable=self.noise_summary_var
-        )
-        self.noise_summary_label.pack(side=tk.LEFT, anchor=tk.W, padx=5)
-
-        # Transient (.TRAN) configuration fields (shown only for Transient)
-        self.tran_frame = create_card(main_frame)
-        tran_inner = self.tran_frame.inner
-        tran_inner.columnconfigure(1, weight=1)
-        tk.Label(
-            tran_inner,
-            text="Transient (.TRAN) Settings",
-            font=FONTS["subheading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
-        ).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 6))
-        # Stop time
-        tk.Label(tran_inner, text="Stop time (s)", bg=COLORS["bg_secondary"], fg=COLORS["text_primary"]).grid(row=1, column=0, sticky=tk.W, pady=3)
-        self.tstop_var = tk.StringVar(value="" if self.tran_settings["tstop"] is None else str(self.tran_settings["tstop"]))
-        ttk.Entry(tran_inner, textvariable=self.tstop_var, width=18).grid(row=1, column=1, sticky=tk.W, pady=3)
-        # Time step (optional)
-        tk.Label(tran_inner, text="Time step (s)", bg=COLORS["bg_secondary"], fg=COLORS["text_primary"]).grid(row=2, column=0, sticky=tk.W, pady=3)
-        self.tstep_var = tk.StringVar(value="" if self.tran_settings["tstep"] is None else str(self.tran_settings["tstep"]))
-        ttk.Entry(tran_inner, textvariable=self.tstep_var, width=18).grid(row=2, column=1, sticky=tk.W, pady=3)
-        # Start time (optional)
-        tk.Label(tran_inner, text="Start time (s)", bg=COLORS["bg_secondary"], fg=COLORS["text_primary"]).grid(row=3, column=0, sticky=tk.W, pady=3)
-        self.tstart_var = tk.StringVar(value="" if self.tran_settings["tstart"] is None else str(self.tran_settings["tstart"]))
-        ttk.Entry(tran_inner, textvariable=self.tstart_var, width=18).grid(row=3, column=1, sticky=tk.W, pady=3)
-        # Max step (optional)
-        tk.Label(tran_inner, text="Max step (s)", bg=COLORS["bg_secondary"], fg=COLORS["text_primary"]).grid(row=4, column=0, sticky=tk.W, pady=3)
-        self.tmax_var = tk.StringVar(value="" if self.tran_settings["max_step"] is None else str(self.tran_settings["max_step"]))
-        ttk.Entry(tran_inner, textvariable=self.tmax_var, width=18).grid(row=4, column=1, sticky=tk.W, pady=3)
-        # UIC toggle
-        self.uic_var = tk.BooleanVar(value=self.tran_settings["uic"])
-        ttk.Checkbutton(
-            tran_inner,
-            text="Use Initial Conditions (UIC)",
-            variable=self.uic_var,
-            style="TCheckbutton",
-        ).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(6, 0))
+        self.ac_config_button = self.ac_details_frame = None
+        self.noise_config_button = self.noise_details_frame = None
+        self.tran_frame = None
+        # analysis type -> ((widget, pack options), ...), filled in as panels are built
+        self._analysis_layouts: Dict[str, Tuple[Tuple[tk.Widget, Dict[str, Any]], ...]] = {}
+        self._shown_layout: Tuple[Tuple[tk.Widget, Dict[str, Any]], ...] = ()
 
         # # --- Settings Panels (Curve Fit) ---
         curve_card = create_card(main_frame)
         curve_card.pack(side=tk.TOP, fill=tk.X, pady=8)
+        self._analysis_anchor = curve_card  # analysis panels are packed right after it
         setting_panel_frame = curve_card.inner
-        tk.Label(
+        ttk.Label(
             setting_panel_frame,
             text="Target Curve",
-            font=FONTS["subheading"],
-            bg=COLORS["bg_secondary"],
-            fg=COLORS["text_primary"],
+            style="CardSubheading.TLabel",
         ).pack(anchor="w", pady=(0, 10))
 
         # Instantiate CurveFitSettings, attaching it to the setting_panel_frame
@@ -314,22 +383,15 @@ class OptimizationSettingsWindow(tk.Frame):
             setting_panel_frame,
             self.selected_parameters,
             self.nodes,
-            controller,
+            self.controller,
             inputs_completed_callback=self.handle_curve_fit_conditions,  # Keep this callback
         )
-        self.curve_fit_settings.set_analysis_context(
-            self.analysis_type,
-            self.ac_settings.get("response", "magnitude"),
-            noise_settings=self.noise_settings,
-        )
+        self._set_ctx_if_changed()
         # Pack the CurveFitSettings panel so it's visible
         self.curve_fit_settings.pack(fill=tk.BOTH, expand=True)
         self._update_ac_summary()
         self._update_noise_summary()
         self._update_analysis_ui()
-        self.controller.update_app_data("analysis_type", self.analysis_type)
-        self.controller.update_app_data("ac_settings", self.ac_settings)
-        self.controller.update_app_data("noise_settings", self.noise_settings)
 
         # --- Constraints Table ---
         constraints_frame = ttk.Frame(main_frame)
@@ -339,14 +401,21 @@ class OptimizationSettingsWindow(tk.Frame):
             side=tk.TOP, anchor=tk.W, pady=5
         )
 
+        table_frame = ttk.Frame(constraints_frame)
+        table_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
         self.constraint_table = ConstraintTable(
-            constraints_frame,
+            table_frame,
             self.open_add_constraint_window,  # Pass the *method* as callback
             self.remove_constraint,  # Pass remove_constraint
             self.open_edit_constraint_dialog,  # Pass edit constraint
         )
         setattr(self.controller, "constraint_table", self.constraint_table)
-        self.constraint_table.pack(fill=tk.BOTH, expand=True)
+        table_scrollbar = ttk.Scrollbar(
+            table_frame, orient=tk.VERTICAL, style="Vertical.TScrollbar"
+        )
+        self.constraint_table.attach_scrollbar(table_scrollbar)
+        table_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.constraint_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # --- Horizontal Button Container (Shared Frame) ---
         button_row_frame = ttk.Frame(constraints_frame)
@@ -444,26 +513,47 @@ class OptimizationSettingsWindow(tk.Frame):
         # xtol
         xtol_label = ttk.Label(entries_row, text="xtol:")
         xtol_label.pack(side=tk.LEFT, padx=(0, 5))
-        self.xtol_var = tk.StringVar(value="1e-12")
-        self.xtol_entry = ttk.Entry(entries_row, width=10, textvariable=self.xtol_var)
+        self.xtol_var = tk.DoubleVar(value=1e-12)
+        self.xtol_entry = ttk.Entry(
+            entries_row,
+            width=10,
+            textvariable=self.xtol_var,
+            validate="key",
+            validatecommand=self._float_vcmd,
+        )
         self.xtol_entry.pack(side=tk.LEFT, padx=(0, 15))
-        self.xtol_entry.bind("<FocusOut>", lambda e: self.validate_float("xtol_var"))
 
         # gtol
         gtol_label = ttk.Label(entries_row, text="gtol:")
         gtol_label.pack(side=tk.LEFT, padx=(0, 5))
-        self.gtol_var = tk.StringVar(value="1e-12")
-        self.gtol_entry = ttk.Entry(entries_row, width=10, textvariable=self.gtol_var)
+        self.gtol_var = tk.DoubleVar(value=1e-12)
+        self.gtol_entry = ttk.Entry(
+            entries_row,
+            width=10,
+            textvariable=self.gtol_var,
+            validate="key",
+            validatecommand=self._float_vcmd,
+        )
         self.gtol_entry.pack(side=tk.LEFT, padx=(0, 15))
-        self.gtol_entry.bind("<FocusOut>", lambda e: self.validate_float("gtol_var"))
 
         # ftol
         ftol_label = ttk.Label(entries_row, text="ftol:")
         ftol_label.pack(side=tk.LEFT, padx=(0, 5))
-        self.ftol_var = tk.StringVar(value="1e-12")
-        self.ftol_entry = ttk.Entry(entries_row, width=10, textvariable=self.ftol_var)
+        self.ftol_var = tk.DoubleVar(value=1e-12)
+        self.ftol_entry = ttk.Entry(
+            entries_row,
+            width=10,
+            textvariable=self.ftol_var,
+            validate="key",
+            validatecommand=self._float_vcmd,
+        )
         self.ftol_entry.pack(side=tk.LEFT)
-        self.ftol_entry.bind("<FocusOut>", lambda e: self.validate_float("ftol_var"))
+        # Captured once so collection reads the DoubleVars directly
+        self._tolerance_fields = (
+            ("xtol", self.xtol_var),
+            ("gtol", self.gtol_var),
+            ("ftol", self.ftol_var),
+        )
 
         # --- Navigation Buttons ---
         navigation_frame = tk.Frame(main_frame, bg=COLORS["bg_primary"])
@@ -479,21 +569,101 @@ class OptimizationSettingsWindow(tk.Frame):
             state=tk.DISABLED,
         )
         self.continue_button.pack(side=tk.RIGHT, padx=5)
+        self._last_continue_state = tk.DISABLED
+
+    def _schedule_scroll_update(self, width_hint: Optional[int] = None) -> None:
+        """Debounce a scrollregion update behind a burst of <Configure> events."""
+        if width_hint is not None:
+            self._pending_width = width_hint
+        if self._scroll_after is not None:
+            self.after_cancel(self._scroll_after)
+        self._scroll_after = self.after(_SCROLL_DEBOUNCE_MS, self._apply_scroll_update)
+
+    def _invalidate_scrollregion(self) -> None:
+        """Request a scrollregion refresh after a structural change to the content."""
+        if self._scroll_after is None:
+            self._scroll_after = self.after_idle(self._apply_scroll_update)
+
+    def _apply_scroll_update(self) -> None:
+        self._scroll_after = None
+        width_hint, self._pending_width = self._pending_width, None
+        canvas = self._canvas
+        if not canvas.winfo_exists():
+            return
+        desired_width = max(self._scrollable_frame.winfo_reqwidth(), width_hint or canvas.winfo_width())
+        if desired_width != self._last_window_width:
+            self._last_window_width = desired_width
+            canvas.itemconfig(self._canvas_window, width=desired_width)
+        bbox = canvas.bbox("all")
+        if bbox != self._last_bbox:
+            self._last_bbox = bbox
+            canvas.configure(scrollregion=bbox)
+
+    def _on_mousewheel(self, event) -> Optional[str]:
+        # destroy() unbinds this hook, so the canvas is alive whenever it runs
+        canvas = self._canvas
+        try:
+            target = canvas.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, tk.TclError):
+            return  # pointer over a Tk-internal window (e.g. a combobox popdown)
+        if target is None or (
+            target is not canvas and not str(target).startswith(str(canvas) + ".")
+        ):
+            return
+        if event.num == 4:
+            self._wheel_accum -= 1
+        elif event.num == 5:
+            self._wheel_accum += 1
+        else:
+            # Keep fractional deltas (touchpads, macOS) so small ticks add up
+            self._wheel_accum -= event.delta / 120
+        if self._wheel_pending is None:
+            self._wheel_pending = self.after(_WHEEL_FLUSH_MS, self._flush_wheel)
+        return "break"
+
+    def destroy(self) -> None:
+        # Restore the app-wide wheel bindings and drop every pending callback so
+        # nothing dispatches into this window after it is gone
+        if self._import_after is not None:
+            self.after_cancel(self._import_after)
+            self._import_after = None
+        for pending in (self._wheel_pending, self._scroll_after):
+            if pending is not None:
+                self.after_cancel(pending)
+        self._wheel_pending = self._scroll_after = None
+        for sequence, previous in self._prev_wheel_bindings.items():
+            self.bind_all(sequence, previous)
+        super().destroy()
+
+    def _flush_wheel(self) -> None:
+        self._wheel_pending = None
+        units = int(self._wheel_accum)
+        self._wheel_accum -= units
+        if units and self._canvas.winfo_exists():
+            self._canvas.yview_scroll(units, "units")
 
     def handle_curve_fit_conditions(self, condition_type, state):
         """Update flags based on inputs from CurveFitSettings."""
         if condition_type == "function_button_pressed":
+            if self.function_button_pressed == state:
+                return
             self.function_button_pressed = state
         elif condition_type == "y_param_dropdown_selected":
+            if self.y_param_dropdown_selected == state:
+                return
             self.y_param_dropdown_selected = state
         elif condition_type == "ac_response_changed":
             self.ac_settings["response"] = state
-            self.controller.update_app_data("ac_settings", self.ac_settings)
-            self._update_ac_summary()
+            if self._settings_changed("ac_settings", self.ac_settings):
+                self._dirty_app_data["ac_settings"] = self.ac_settings
+                self._flush_app_data()
+                self._update_ac_summary()
         elif condition_type == "noise_output_node":
             self.noise_settings["output_node"] = state or ""
-            self.controller.update_app_data("noise_settings", self.noise_settings)
-            self._update_noise_summary()
+            if self._settings_changed("noise_settings", self.noise_settings):
+                self._dirty_app_data["noise_settings"] = self.noise_settings
+                self._flush_app_data()
+                self._update_noise_summary()
 
         # Check if all conditions are met
         self.update_continue_button_state()
@@ -501,143 +671,219 @@ class OptimizationSettingsWindow(tk.Frame):
     def update_continue_button_state(self):
         """Enable the 'Begin Optimization' button if all conditions are met."""
         if self.function_button_pressed and self.y_param_dropdown_selected:
-            self.continue_button.config(state=tk.NORMAL)
+            new_state = tk.NORMAL
         else:
-            self.continue_button.config(state=tk.DISABLED)
+            new_state = tk.DISABLED
+        if new_state == self._last_continue_state:
+            return
+        self._last_continue_state = new_state
+        self.continue_button.config(state=new_state)
 
     def _update_ac_summary(self) -> None:
         if not self.ac_settings:
             self.ac_summary_var.set("")
             return
-        response = self.ac_settings.get("response", "magnitude").lower()
-        response_label = {
-            "magnitude": "Magnitude",
-            "magnitude_db": "Magnitude (dB)",
-            "phase": "Phase",
-            "real": "Real",
-            "imag": "Imag",
-        }.get(response, response.capitalize())
-        summary = (
-            f"{self.ac_settings['sweep_type']} sweep, "
-            f"{self.ac_settings['points']} points, "
-            f"{self.ac_settings['start_frequency']:.3g} -> "
-            f"{self.ac_settings['stop_frequency']:.3g} Hz, "
-            f"{response_label}"
+        settings = self.ac_settings
+        key = (
+            settings["sweep_type"],
+            settings["points"],
+            settings["start_frequency"],
+            settings["stop_frequency"],
+            settings.get("response", "magnitude"),
         )
+        summary = _SUMMARY_CACHE.get(("ac", key))
+        if summary is None:
+            response = key[4].lower()
+            response_label = _AC_RESPONSE_LABELS.get(response) or response.capitalize()
+            summary = (
+                f"{key[0]} sweep, {key[1]} points, "
+                f"{key[2]:.3g} -> {key[3]:.3g} Hz, {response_label}"
+            )
+            _remember_summary(("ac", key), summary)
         self.ac_summary_var.set(summary)
 
     def _update_noise_summary(self) -> None:
         if not self.noise_settings or self.analysis_type != "noise":
             self.noise_summary_var.set("")
             return
-        quantity_map = {
-            "onoise": "Output noise (V/√Hz)",
-            "onoise_db": "Output noise (dB/√Hz)",
-            "inoise": "Input-referred noise (V/√Hz)",
-            "inoise_db": "Input-referred noise (dB/√Hz)",
-        }
-        quantity = self.noise_settings.get("quantity", "onoise").lower()
-        quantity_label = quantity_map.get(quantity, quantity_map["onoise"])
-        summary = (
-            f"{self.noise_settings['sweep_type']} sweep, "
-            f"{self.noise_settings['points']} points, "
-            f"{self.noise_settings['start_frequency']:.3g} -> "
-            f"{self.noise_settings['stop_frequency']:.3g} Hz, "
-            f"{quantity_label}"
-        )
-        node = self.noise_settings.get("output_node")
-        source = self.noise_settings.get("input_source")
-        if node or source:
-            summary += f" (node {node or '?'} vs source {source or '?'})"
+        settings = self.noise_settings
+        key = (
+            settings["sweep_type"],
+            settings["points"],
+            settings["start_frequency"],
+            settings["stop_frequency"],
+            settings.get("quantity", "onoise"),
+            settings.get("output_node"),
+            settings.get("input_source"),
+        )
+        summary = _SUMMARY_CACHE.get(("noise", key))
+        if summary is None:
+            quantity = key[4].lower()
+            quantity_label = _NOISE_QUANTITY_LABELS.get(quantity, _NOISE_QUANTITY_LABELS["onoise"])
+            summary = (
+                f"{key[0]} sweep, {key[1]} points, "
+                f"{key[2]:.3g} -> {key[3]:.3g} Hz, {quantity_label}"
+            )
+            node, source = key[5], key[6]
+            if node or source:
+                summary += f" (node {node or '?'} vs source {source or '?'})"
+            _remember_summary(("noise", key), summary)
         self.noise_summary_var.set(summary)
 
+    def _build_ac_panel(self):
+        self.ac_config_button = create_secondary_button(
+            self._analysis_type_frame,
+            text="Configure AC Sweep...",
+            command=self.open_ac_settings,
+        )
+        self.ac_details_frame = ttk.Frame(self._main_frame)
+        self.ac_summary_label = ttk.Label(
+            self.ac_details_frame, textvariable=self.ac_summary_var
+        )
+        self.ac_summary_label.pack(side=tk.LEFT, anchor=tk.W, padx=5)
+        return (
+            (self.ac_config_button, {"side": tk.LEFT, "pady": 5}),
+            (self.ac_details_frame, {"side": tk.TOP, "fill": tk.X, "padx": 5, "pady": (0, 5),
+                                     "after": self._analysis_anchor}),
+        )
+
+    def _build_noise_panel(self):
+        self.noise_config_button = create_secondary_button(
+            self._analysis_type_frame,
+            text="Configure Noise Sweep...",
+            command=self.open_noise_settings,
+        )
+        self.noise_details_frame = ttk.Frame(self._main_frame)
+        self.noise_summary_label = ttk.Label(
+            self.noise_details_frame, textvariable=self.noise_summary_var
+        )
+        self.noise_summary_label.pack(side=tk.LEFT, anchor=tk.W, padx=5)
+        return (
+            (self.noise_config_button, {"side": tk.LEFT, "pady": 5}),
+            (self.noise_details_frame, {"side": tk.TOP, "fill": tk.X, "padx": 5, "pady": (0, 5),
+                                        "after": self._analysis_anchor}),
+        )
+
+    def _build_tran_frame(self):
+        """Transient (.TRAN) configuration fields (shown only for Transient)."""
+        self.tran_frame = create_card(self._main_frame)
+        tran_inner = self.tran_frame.inner
+        tran_inner.columnconfigure(1, weight=1)
+        ttk.Label(
+            tran_inner,
+            text="Transient (.TRAN) Settings",
+            style="CardSubheading.TLabel",
+        ).grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 6))
+        # Stop time
+        ttk.Label(tran_inner, text="Stop time (s)", style="Card.TLabel").grid(row=1, column=0, sticky=tk.W, pady=3)
+        self.tstop_var = tk.StringVar(value="" if self.tran_settings["tstop"] is None else str(self.tran_settings["tstop"]))
+        ttk.Entry(
+            tran_inner,
+            textvariable=self.tstop_var,
+            width=18,
+            validate="key",
+            validatecommand=self._float_vcmd,
+        ).grid(row=1, column=1, sticky=tk.W, pady=3)
+        # Time step (optional)
+        ttk.Label(tran_inner, text="Time step (s)", style="Card.TLabel").grid(row=2, column=0, sticky=tk.W, pady=3)
+        self.tstep_var = tk.StringVar(value="" if self.tran_settings["tstep"] is None else str(self.tran_settings["tstep"]))
+        ttk.Entry(
+            tran_inner,
+            textvariable=self.tstep_var,
+            width=18,
+            validate="key",
+            validatecommand=self._float_vcmd,
+        ).grid(row=2, column=1, sticky=tk.W, pady=3)
+        # Start time (optional)
+        ttk.Label(tran_inner, text="Start time (s)", style="Card.TLabel").grid(row=3, column=0, sticky=tk.W, pady=3)
+        self.tstart_var = tk.StringVar(value="" if self.tran_settings["tstart"] is None else str(self.tran_settings["tstart"]))
+        ttk.Entry(
+            tran_inner,
+            textvariable=self.tstart_var,
+            width=18,
+            validate="key",
+            validatecommand=self._float_vcmd,
+        ).grid(row=3, column=1, sticky=tk.W, pady=3)
+        # Max step (optional)
+        ttk.Label(tran_inner, text="Max step (s)", style="Card.TLabel").grid(row=4, column=0, sticky=tk.W, pady=3)
+        self.tmax_var = tk.StringVar(value="" if self.tran_settings["max_step"] is None else str(self.tran_settings["max_step"]))
+        ttk.Entry(
+            tran_inner,
+            textvariable=self.tmax_var,
+            width=18,
+            validate="key",
+            validatecommand=self._float_vcmd,
+        ).grid(row=4, column=1, sticky=tk.W, pady=3)
+        # UIC toggle
+        self.uic_var = tk.BooleanVar(value=self.tran_settings["uic"])
+        ttk.Checkbutton(
+            tran_inner,
+            text="Use Initial Conditions (UIC)",
+            variable=self.uic_var,
+            style="TCheckbutton",
+        ).grid(row=5, column=0, columnspan=2, sticky=tk.W, pady=(6, 0))
+        return (
+            (self.tran_frame, {"fill": tk.X, "padx": 32, "pady": (0, 8), "after": self._analysis_anchor}),
+        )
+
     def _update_analysis_ui(self) -> None:
-        if self.analysis_type == "ac":
-            if not self.ac_config_button.winfo_ismapped():
-                self.ac_config_button.pack(side=tk.LEFT, pady=5)
-            if not self.ac_details_frame.winfo_ismapped():
-                self.ac_details_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=(0, 5))
-            if self.noise_config_button.winfo_ismapped():
-                self.noise_config_button.pack_forget()
-            if self.noise_details_frame.winfo_ismapped():
-                self.noise_details_frame.pack_forget()
-            if self.tran_frame.winfo_ismapped():
-                self.tran_frame.pack_forget()
-        elif self.analysis_type == "noise":
-            if self.ac_config_button.winfo_ismapped():
-                self.ac_config_button.pack_forget()
-            if self.ac_details_frame.winfo_ismapped():
-                self.ac_details_frame.pack_forget()
-            if not self.noise_config_button.winfo_ismapped():
-                self.noise_config_button.pack(side=tk.LEFT, pady=5)
-            if not self.noise_details_frame.winfo_ismapped():
-                self.noise_details_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=(0, 5))
-            if self.tran_frame.winfo_ismapped():
-                self.tran_frame.pack_forget()
-        else:
-            if self.ac_config_button.winfo_ismapped():
-                self.ac_config_button.pack_forget()
-            if self.ac_details_frame.winfo_ismapped():
-                self.ac_details_frame.pack_forget()
-            if self.noise_config_button.winfo_ismapped():
-                self.noise_config_button.pack_forget()
-            if self.noise_details_frame.winfo_ismapped():
-                self.noise_details_frame.pack_forget()
-            if not self.tran_frame.winfo_ismapped():
-                self.tran_frame.pack(fill=tk.X, padx=32, pady=(0, 8))
+        if self.analysis_type == self._last_analysis_type:
+            return
+        self._last_analysis_type = self.analysis_type
+        layout = self._analysis_layouts.get(self.analysis_type)
+        if layout is None:
+            builder = {
+                "ac": self._build_ac_panel,
+                "noise": self._build_noise_panel,
+            }.get(self.analysis_type, self._build_tran_frame)
+            layout = self._analysis_layouts[self.analysis_type] = builder()
+        # Panels never share widgets, so swap the previous set for the new one
+        for widget, _ in self._shown_layout:
+            widget.pack_forget()
+        for widget, options in layout:
+            widget.pack(**options)
+        self._shown_layout = layout
+        self._invalidate_scrollregion()
 
     def open_ac_settings(self):
         dialog = AcSettingsDialog(self, self.ac_settings)
         self.wait_window(dialog)
-        if dialog.result:
+        if dialog.result and self._settings_changed("ac_settings", dialog.result):
             self.ac_settings = dialog.result
-            self.controller.update_app_data("ac_settings", self.ac_settings)
+            self._dirty_app_data["ac_settings"] = self.ac_settings
+            self._flush_app_data()
             self._update_ac_summary()
             self._update_analysis_ui()
-            self.curve_fit_settings.set_analysis_context(
-                self.analysis_type,
-                self.ac_settings.get("response", "magnitude"),
-                noise_settings=self.noise_settings,
-            )
+            self._set_ctx_if_changed()
 
     def open_noise_settings(self):
         dialog = NoiseSettingsDialog(
             self,
-            sorted(self.nodes),
+            self._sorted_nodes,
             self.source_names,
             self.noise_settings,
         )
         self.wait_window(dialog)
-        if dialog.result:
+        if dialog.result and self._settings_changed(
+            "noise_settings", {**self.noise_settings, **dialog.result}
+        ):
             self.noise_settings.update(dialog.result)
-            self.controller.update_app_data("noise_settings", self.noise_settings)
+            self._dirty_app_data["noise_settings"] = self.noise_settings
+            self._flush_app_data()
             self._update_noise_summary()
             self._update_analysis_ui()
-            self.curve_fit_settings.set_analysis_context(
-                self.analysis_type,
-                self.ac_settings.get("response", "magnitude"),
-                noise_settings=self.noise_settings,
-            )
+            self._set_ctx_if_changed()
 
     def on_optimization_type_change(self, event=None):
         selected_type = self.optimization_type_var.get()
 
     def on_analysis_type_change(self, event=None):
         selection = (self.analysis_type_var.get() or "Transient").strip().lower()
-        if selection == "ac":
-            self.analysis_type = "ac"
-        elif selection == "noise":
-            self.analysis_type = "noise"
-        else:
-            self.analysis_type = "transient"
-        self.controller.update_app_data("analysis_type", self.analysis_type)
-        self.controller.update_app_data("ac_settings", self.ac_settings)
-        self.controller.update_app_data("noise_settings", self.noise_settings)
-        self.curve_fit_settings.set_analysis_context(
-            self.analysis_type,
-            self.ac_settings.get("response", "magnitude"),
-            noise_settings=self.noise_settings,
-        )
+        self.analysis_type = selection if selection in _ANALYSIS_LABELS else "transient"
+        # ac/noise settings are already on the controller; only the type changed
+        self._dirty_app_data["analysis_type"] = self.analysis_type
+        self._flush_app_data()
+        self._set_ctx_if_changed()
         self._update_analysis_ui()
 
     def open_add_constraint_window(self):
@@ -653,25 +899,24 @@ class OptimizationSettingsWindow(tk.Frame):
 
     def _determine_constraint_type(self, left_expression: str) -> Optional[str]:
         """Determines if the left side is a parameter or node expression."""
-        if left_expression in (self.selected_parameters or []):
-            return "parameter"
-        elif (
-            left_expression in self.node_voltage_expressions
-        ):  # Add checks for other node types if needed
-            return "node"
-        else:
-            # Could potentially be a more complex expression, but we're simplifying
-            # Check if it's *only* a known parameter or node expression
-            # You might need more robust parsing if left side can be complex later
-            is_valid_expr, used_vars = ExpressionEvaluator(
-                self.all_allowed_validation_vars
-            ).validate_expression(left_expression)
-            if is_valid_expr and len(used_vars) == 1:
-                if used_vars[0] in (self.selected_parameters or []):
-                    return "parameter"
-                if used_vars[0] in self.node_voltage_expressions:
-                    return "node"
-            return None  # Indicates an invalid or unsupported left-hand side format
+        constraint_type = self._name_kind.get(left_expression)
+        if constraint_type is not None:
+            return constraint_type
+        try:
+            return self._constraint_type_cache[left_expression]
+        except KeyError:
+            pass
+        # Could potentially be a more complex expression, but we're simplifying
+        # Check if it's *only* a known parameter or node expression
+        # You might need more robust parsing if left side can be complex later
+        if self._expr_evaluator is None:
+            self._expr_evaluator = evaluator_for(frozenset(self._name_kind), frozenset())
+        is_valid_expr, used_vars = self._expr_evaluator.validate_expression(left_expression)
+        constraint_type = None  # Indicates an invalid or unsupported left-hand side format
+        if is_valid_expr and len(used_vars) == 1:
+            constraint_type = self._name_kind.get(used_vars[0])
+        self._constraint_type_cache[left_expression] = constraint_type
+        return constraint_type
 
     def add_constraint(self, constraint_data: Dict[str, str]):
         """Adds the constraint type and stores it."""
@@ -689,35 +934,45 @@ class OptimizationSettingsWindow(tk.Frame):
         constraint_data["type"] = constraint_type
 
         self.constraints.append(constraint_data)  # Store the constraint with its type
-        print(f"Added Constraint: {constraint_data}")  # Debug
-        # Modify constraint_table.add_constraint to accept and potentially display the type
+        # The Treeview has a fixed height, so a new row never changes the form's
+        # geometry and needs no scrollregion refresh
         self.constraint_table.add_constraint(constraint_data)
 
     def open_edit_constraint_dialog(self, constraint: Dict[str, str], index: int):
-        dialog = EditConstraintDialog(
+        # Imported on first use so the dialog module stays off the startup path
+        from .edit_constraint_dialog import EditConstraintDialog
+
+        # The dialog reports back through on_done, so the window keeps running meanwhile.
+        # Rows can move while it is open, so the edit targets the stored object, not the index
+        original = self.constraints[index]
+        EditConstraintDialog(
             self,
             self.selected_parameters,
             self.node_voltage_expressions,
             constraint,
             self.allowed_constraint_left_sides,
             preview_callback=getattr(self.controller, "constraint_preview", None),
+            on_done=lambda new_constraint: self._apply_edit(original, new_constraint),
         )
-        self.wait_window(dialog)  # Wait for dialog to close
-        if dialog.constraint is not None:
-            new_constraint = (
-                dialog.constraint
-            )  # Assume EditDialog updated its self.constraint
-            constraint_type = self._determine_constraint_type(new_constraint["left"])
-            if constraint_type is None:
-                messagebox.showerror(
-                    "Error", f"Invalid left-hand side: {new_constraint['left']}"
-                )
-                return
-            new_constraint["type"] = constraint_type  # Add/Update type
-            self.constraints[index] = new_constraint
-            self.constraint_table.update_constraint(
-                index, new_constraint
-            )  # Update table (needs type support)
+
+    def _apply_edit(self, original: Dict[str, str], new_constraint: Dict[str, str]):
+        """Replaces `original` with the edited constraint once its dialog has been saved."""
+        index = next(
+            (i for i, constraint in enumerate(self.constraints) if constraint is original), None
+        )
+        if index is None:
+            return  # the constraint was removed or replaced while the dialog was open
+        constraint_type = self._determine_constraint_type(new_constraint["left"])
+        if constraint_type is None:
+            messagebox.showerror(
+                "Error", f"Invalid left-hand side: {new_constraint['left']}"
+            )
+            return
+        new_constraint["type"] = constraint_type  # Add/Update type
+        self.constraints[index] = new_constraint
+        self.constraint_table.update_constraint(
+            index, new_constraint
+        )  # Update table (needs type support)
 
     def remove_constraint(self):
         # get selected from treeview and index
@@ -725,10 +980,8 @@ class OptimizationSettingsWindow(tk.Frame):
         if not selected_items:
             messagebox.showinfo("Info", "Please select a constraint to remove.")
             return
-        # loop in reverse to prevent index issues
-        for selected in reversed(selected_items):
-            index = self.constraint_table.index(selected)
-            self.constraint_table.delete(selected)
+        # indices come back highest first, so deleting in order is safe
+        for index in self.constraint_table.remove_rows(selected_items):
             del self.constraints[index]
 
     def edit_constraint(self):
@@ -742,7 +995,7 @@ class OptimizationSettingsWindow(tk.Frame):
             return
 
         selected_item = selected_items[0]
-        index = self.constraint_table.index(selected_item)
+        index = self.constraint_table.index_of(selected_item)
         #  CRUCIAL: We need to get the constraint data *from the Treeview*,
         #   NOT from the potentially outdated self.controller.constraints.
         values = self.constraint_table.item(selected_item, "values")
@@ -756,15 +1009,6 @@ class OptimizationSettingsWindow(tk.Frame):
         if self.analysis_type != "transient":
             return None
 
-        def _parse_optional(var: tk.StringVar, label: str) -> (Optional[float], Optional[str]):
-            raw = (var.get() or "").strip()
-            if raw == "":
-                return None, None
-            try:
-                return float(raw), None
-            except ValueError:
-                return None, label
-
         invalid_fields = []
         tstop, tstop_err = _parse_optional(self.tstop_var, "Stop time")
         if tstop is None:
@@ -795,122 +1039,193 @@ class OptimizationSettingsWindow(tk.Frame):
             "uic": bool(self.uic_var.get()),
         }
 
-    def go_forward(self):
-        # --- Get all constraints (they now include the 'type' key) ---
-        all_constraints = (
-            self.constraints
-        )  # List of dicts like {'left': 'R1', ..., 'type': 'parameter'}
-        generated_data = self.controller.get_app_data("generated_data") or []
-
-        # --- Separate constraints by type ---
-        parameter_constraints = [
-            c for c in all_constraints if c.get("type") == "parameter"
-        ]
-        node_constraints_from_ui = [
-            c for c in all_constraints if c.get("type") == "node"
-        ]
-        untyped_constraints = [
-            c for c in all_constraints if c.get("type") not in ["parameter", "node"]
-        ]
-
-        print(f"Found {len(parameter_constraints)} parameter constraints:")
-        # for pc in parameter_constraints: print(f"  {pc}")
-        print(f"Found {len(node_constraints_from_ui)} node constraints:")
-        # for nc in node_constraints_from_ui: print(f"  {nc}")
-        if untyped_constraints:
-            print(
-                f"Warning: Found {len(untyped_constraints)} constraints without a valid type."
+    @staticmethod
+    def _validate_float_key(new_value: str) -> bool:
+        """Accept anything float() takes, plus partial input like "-", "1e-" or "in"."""
+        for candidate in (new_value, new_value + "0"):
+            try:
+                float(candidate)
+                return True
+            except ValueError:
+                pass
+        word = new_value.strip().lower()
+        if word[:1] in ("+", "-"):
+            word = word[1:]
+        return "infinity".startswith(word) or "nan".startswith(word)
+
+    def _collect_tolerances(self) -> Optional[List[float]]:
+        """Read xtol/gtol/ftol once; report every invalid field in a single dialog."""
+        values, invalid = [], []
+        for label, var in self._tolerance_fields:
+            try:
+                values.append(var.get())  # DoubleVar: Tcl converts, no Python parse
+            except (tk.TclError, ValueError):
+                invalid.append(label)
+        if invalid:
+            messagebox.showerror(
+                "Invalid Input",
+                "Please enter a valid number for: " + ", ".join(invalid),
+            )
+            return None
+        return values
+
+    def _finalize_ac(self, optimization_settings, curve_settings, _noise_output_node) -> bool:
+        ac_response = curve_settings.get("ac_response")
+        if ac_response:
+            self.ac_settings["response"] = ac_response
+        optimization_settings["ac_settings"] = dict(self.ac_settings)
+        optimization_settings["noise_settings"] = {}
+        optimization_settings["tran_settings"] = {}
+        return True
+
+    def _finalize_noise(self, optimization_settings, curve_settings, noise_output_node) -> bool:
+        noise_quantity = curve_settings.get("noise_quantity")
+        if noise_output_node:
+            self.noise_settings["output_node"] = noise_output_node
+        if noise_quantity:
+            self.noise_settings["quantity"] = noise_quantity
+        if not self.noise_settings.get("output_node"):
+            messagebox.showerror(
+                "Noise Output Required",
+                "Select the node where noise will be measured before running optimization.",
+            )
+            return False
+        if not self.noise_settings.get("input_source"):
+            messagebox.showerror(
+                "Noise Source Required",
+                "Configure the noise analysis to choose a driving source.",
             )
+            return False
+        optimization_settings["ac_settings"] = {}
+        optimization_settings["noise_settings"] = dict(self.noise_settings)
+        return True
+
+    def _finalize_tran(self, optimization_settings, _curve_settings, _noise_output_node) -> bool:
+        tran_settings = self._collect_tran_settings()
+        if tran_settings is None:
+            return False
+        optimization_settings["ac_settings"] = {}
+        optimization_settings["noise_settings"] = {}
+        optimization_settings["tran_settings"] = tran_settings
+        return True
+
+    def go_forward(self):
+        generated_data = self.controller.get_app_data("generated_data")
         optimization_settings = {
             "optimization_type": self.optimization_type_var.get(),
             "constraints": self.constraints,
         }
-        if not generated_data:
+        if generated_data is None or len(generated_data) == 0:
             messagebox.showerror(
                 "Target Required",
                 "Please define or import a target curve before starting the optimization.",
             )
             return
+        tolerances = self._collect_tolerances()
+        if tolerances is None:
+            return
         curve_settings = self.curve_fit_settings.get_settings()
         noise_output_node = curve_settings.pop("noise_output_node", None)
-        noise_quantity = curve_settings.get("noise_quantity")
-        ac_response = curve_settings.get("ac_response")
         optimization_settings.update(curve_settings)
         optimization_settings["analysis_type"] = self.analysis_type
-        if self.analysis_type == "ac":
-            if ac_response:
-                self.ac_settings["response"] = ac_response
-            optimization_settings["ac_settings"] = dict(self.ac_settings)
-            optimization_settings["noise_settings"] = {}
-            optimization_settings["tran_settings"] = {}
-        elif self.analysis_type == "noise":
-            if noise_output_node:
-                self.noise_settings["output_node"] = noise_output_node
-            if noise_quantity:
-                self.noise_settings["quantity"] = noise_quantity
-            if not self.noise_settings.get("output_node"):
-                messagebox.showerror(
-                    "Noise Output Required",
-                    "Select the node where noise will be measured before running optimization.",
-                )
-                return
-            if not self.noise_settings.get("input_source"):
-                messagebox.showerror(
-                    "Noise Source Required",
-                    "Configure the noise analysis to choose a driving source.",
-                )
-                return
-            optimization_settings["ac_settings"] = {}
-            optimization_settings["noise_settings"] = dict(self.noise_settings)
-        else:
-            tran_settings = self._collect_tran_settings()
-            if tran_settings is None:
-                return
-            optimization_settings["ac_settings"] = {}
-            optimization_settings["noise_settings"] = {}
-            optimization_settings["tran_settings"] = tran_settings
-
-        print("AC settings before run:", optimization_settings.get("ac_settings"))
-
-        self.controller.update_app_data("analysis_type", self.analysis_type)
-        self.controller.update_app_data("ac_settings", self.ac_settings)
-        self.controller.update_app_data("noise_settings", self.noise_settings)
-        self.controller.update_app_data("tran_settings", optimization_settings.get("tran_settings", {}))
-
-        self.controller.update_app_data("optimization_settings", optimization_settings)
-        self.controller.update_app_data("pending_start", True)
-        self.controller.update_app_data(
-            "optimization_tolerances",
-            [
-                float(self.xtol_var.get()),
-                float(self.gtol_var.get()),
-                float(self.ftol_var.get()),
-            ],
-        )
-        self.controller.update_app_data(
-            "RLC_bounds",
-            [
+        finalizers = {
+            "ac": self._finalize_ac,
+            "noise": self._finalize_noise,
+        }
+        finalize = finalizers.get(self.analysis_type, self._finalize_tran)
+        if not finalize(optimization_settings, curve_settings, noise_output_node):
+            return
+
+        self._dirty_app_data.update(
+            analysis_type=self.analysis_type,
+            ac_settings=self.ac_settings,
+            noise_settings=self.noise_settings,
+            tran_settings=optimization_settings.get("tran_settings", {}),
+            optimization_settings=optimization_settings,
+            pending_start=True,
+            optimization_tolerances=tolerances,
+            RLC_bounds=[
                 self.enable_R_bounds.get(),
                 self.enable_L_bounds.get(),
                 self.enable_C_bounds.get(),
             ],
+            # Reset results so the next summary view starts a fresh optimization run
+            optimization_results=None,
         )
-        # Reset results so the next summary view starts a fresh optimization run
-        self.controller.update_app_data("optimization_results", None)
+        self._flush_app_data()
         self.controller.navigate("optimization_summary")
 
     def import_constraints(self):
-        """Imports constraints from a JSON file."""
-        constraints = import_constraints_from_file()
-        if constraints is not None:
-            # Clear existing constraints
-            self.constraints = []
-            self.constraint_table.clear()
-
-            # Add the imported constraints
-            for constraint in constraints:
-                self.add_constraint(constraint)
-            messagebox.showinfo("Info", "Constraints imported successfully.")
+        """Imports constraints from a JSON file.
+
+        The file is read and parsed on a worker thread; the constraints are then
+        typed and added to the table in chunks from the Tk loop.
+        """
+        if self._import_after is not None:
+            return  # an import is already running
+        file_path = ask_constraints_file_path()
+        if not file_path:
+            return
+        self._import_queue = queue.Queue()
+        self._import_thread = th.Thread(
+            target=self._import_worker,
+            args=(file_path, self._import_queue),
+        )
+        self._import_thread.daemon = True
+        self._import_thread.start()
+        self._import_after = self.after(_IMPORT_POLL_MS, self._poll_import)
+
+    def _import_worker(self, file_path: str, results: "queue.Queue"):
+        """Reads and parses the constraints file off the Tk thread."""
+        try:
+            results.put(("loaded", load_constraints_file(file_path)))
+        except ValueError as e:
+            results.put(("error", str(e)))
+
+    def _poll_import(self):
+        try:
+            kind, payload = self._import_queue.get_nowait()
+        except queue.Empty:
+            self._import_after = self.after(_IMPORT_POLL_MS, self._poll_import)
+            return
+        self._import_after = None
+        if kind == "error":
+            messagebox.showerror("Error", payload)
+            return
+        # Clear existing constraints only once the file has parsed
+        self.constraints = []
+        self.constraint_table.clear()
+        self._add_imported_chunk(payload, 0, [])
+
+    def _add_imported_chunk(self, constraints: List[Dict[str, str]], start: int, invalid: List[str]):
+        """Types and adds one chunk of imported constraints, then yields to the event loop."""
+        self._import_after = None
+        chunk = []
+        for constraint in constraints[start:start + _IMPORT_CHUNK_SIZE]:
+            left_side = constraint.get("left", "")
+            constraint_type = self._determine_constraint_type(left_side)
+            if constraint_type is None:
+                invalid.append(str(left_side))
+                continue
+            constraint["type"] = constraint_type
+            chunk.append(constraint)
+        self.constraints.extend(chunk)
+        self.constraint_table.add_constraints_bulk(chunk)
+        start += _IMPORT_CHUNK_SIZE
+        if start < len(constraints):
+            self._import_after = self.after(1, self._add_imported_chunk, constraints, start, invalid)
+        else:
+            self._finish_import(invalid)
+
+    def _finish_import(self, invalid: List[str]):
+        if invalid:
+            messagebox.showerror(
+                "Error Adding Constraint",
+                f"Skipped {len(invalid)} constraint(s) with an invalid left-hand side: "
+                + ", ".join(f"'{left}'" for left in invalid)
+                + ". Must be a single selected parameter or node expression (e.g., V(node)).",
+            )
+        messagebox.showinfo("Info", "Constraints imported successfully.")
 
     def export_constraints(self):
         """Exports constraints to a JSON file."""
@@ -1,3 +1,4 @@
+import time
 import tkinter as tk
 from tkinter import ttk, StringVar, BooleanVar, simpledialog
 import numpy as np
@@ -12,6 +13,79 @@ from ..ui_theme import (
 )
 
 
+# Drag redraws are capped at ~30 fps; motion events arrive far faster than that
+_MOTION_INTERVAL_S = 1 / 30
+
+def _editor_shell(owner, kind, title, geometry, figsize):
+    """
+    Return a window/figure for an editor kind, reusing one of owner's closed editors.
+    Closing only withdraws the window; reopening clears the axes, destroys the
+    previous session's Tk controls and drops its Matplotlib callbacks, so the
+    editor body can rebuild its state while the Figure/canvas are kept. Editors
+    that are still open are never taken over; a new window is made instead.
+    """
+    shells = owner.__dict__.setdefault("_editor_shells", {}).setdefault(kind, [])
+    shells[:] = [shell for shell in shells if shell["win"].winfo_exists()]
+    shell = next((sh for sh in shells if sh["win"].state() == "withdrawn"), None)
+    if shell is None:
+        win = tk.Toplevel(owner)
+        win.title(title)
+        win.geometry(geometry)
+        apply_modern_theme(win)
+        win.configure(bg=COLORS["bg_primary"])
+        win.protocol("WM_DELETE_WINDOW", win.withdraw)
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot(111)
+        canvas = FigureCanvasTkAgg(fig, master=win)
+        canvas_widget = canvas.get_tk_widget()
+        canvas_widget.configure(bg=COLORS["bg_primary"], highlightthickness=0)
+        canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        shell = {"win": win, "fig": fig, "ax": ax, "canvas": canvas, "cids": []}
+        shells.append(shell)
+    else:
+        canvas_widget = shell["canvas"].get_tk_widget()
+        for cid in shell["cids"]:
+            shell["canvas"].mpl_disconnect(cid)
+        shell["cids"].clear()
+        for child in shell["win"].winfo_children():
+            if str(child) != str(canvas_widget):
+                child.destroy()
+        shell["ax"].clear()
+        shell["win"].deiconify()
+        shell["win"].lift()
+    # Identifies this open; callbacks scheduled by an earlier session check it
+    shell["session"] = object()
+    return shell
+
+
+def _connect(shell, event, handler):
+    shell["cids"].append(shell["canvas"].mpl_connect(event, handler))
+
+
+def _set_animated(artists, animated):
+    """Animated artists are left out of full draws so they can be blitted while dragging."""
+    for artist in artists:
+        artist.set_animated(animated)
+
+
+def _blit(canvas, ax, state, artists):
+    """
+    Draw only `artists` over a cached copy of the axes; the background is
+    re-captured with one full draw whenever the view limits or the axes'
+    on-screen box (e.g. after a window resize) have changed.
+    """
+    view = (ax.get_xlim(), ax.get_ylim(), tuple(ax.bbox.bounds))
+    if state.get("bg") is None or state.get("view") != view:
+        canvas.draw()
+        state["bg"] = canvas.copy_from_bbox(ax.bbox)
+        state["view"] = view
+    else:
+        canvas.restore_region(state["bg"])
+    for artist in artists:
+        ax.draw_artist(artist)
+    canvas.blit(ax.bbox)
+
+
 def _apply_axis_labels(ax, axis_labels):
     """
     Apply contextual axis labels if provided, otherwise fall back to x/y.
@@ -178,18 +252,10 @@ def open_heaviside_editor(owner, a_init, t0_init, x1_init, on_change=None, on_ap
       on_change(a,t0,x1)  -> called on every live change
       on_apply(a,t0,x1)   -> called when user clicks Apply
     """
-    win = tk.Toplevel(owner)
-    win.title("Heaviside Editor")
-    win.geometry("860x560")
-    apply_modern_theme(win)
-    win.configure(bg=COLORS["bg_primary"])
-
-    fig = Figure(figsize=(7.8, 4.2))
-    ax = fig.add_subplot(111); ax.grid(True); _apply_axis_labels(ax, axis_labels)
-    canvas = FigureCanvasTkAgg(fig, master=win)
-    canvas_widget = canvas.get_tk_widget()
-    canvas_widget.configure(bg=COLORS["bg_primary"], highlightthickness=0)
-    canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+    shell = _editor_shell(owner, "heaviside", "Heaviside Editor", "860x560", (7.8, 4.2))
+    session = shell["session"]
+    win, ax, canvas = shell["win"], shell["ax"], shell["canvas"]
+    ax.grid(True); _apply_axis_labels(ax, axis_labels)
 
     bar = ttk.Frame(win, style="Card.TFrame"); bar.pack(fill=tk.X, padx=8, pady=6)
 
@@ -230,6 +296,9 @@ def open_heaviside_editor(owner, a_init, t0_init, x1_init, on_change=None, on_ap
 
     # State
     drag = {"amp": False, "t0": False}
+    # Values dragged but not yet written to the entries; they are synced once on release
+    live = {}
+    blit_state = {}  # cached axes background while dragging
 
     step_line = None
     t0_vline = None
@@ -245,23 +314,28 @@ def open_heaviside_editor(owner, a_init, t0_init, x1_init, on_change=None, on_ap
             amp_handle = ax.scatter([], [], s=90, zorder=3, picker=6)  # NEW: easier to grab
 
     def _get_vals():
-        return float(v_a.get()), float(v_x0.get()), float(v_x1.get())
+        a, t0, x1 = float(v_a.get()), float(v_x0.get()), float(v_x1.get())
+        return live.get("a", a), live.get("t0", t0), x1
+
+    # Over [t0, x1] the step is constant, so its two endpoints describe it exactly;
+    # the buffers are reused for every redraw instead of sampling 200 points
+    step_xs = np.empty(2)
+    step_ys = np.empty(2)
 
     def _stair_xy(a, t0, x1):
-        xs = np.linspace(t0, x1, 200)
-        ys = np.where(xs >= t0, a, 0.0)
-        return xs, ys
+        step_xs[0] = t0; step_xs[1] = x1
+        step_ys[:] = a
+        return step_xs, step_ys
 
     def _bounds(a, t0, x1):
-        X, Y = _stair_xy(a, t0, x1)
-        xmin, xmax = float(min(X)), float(max(X))
-        ymin, ymax = float(min(Y)), float(max(Y))
+        xmin, xmax = float(t0), float(x1)
+        ymin = ymax = float(a)
         if xmax <= xmin: xmax = xmin + 1.0
         px = 0.08 * (xmax - xmin)
         py = 0.25 * max(1.0, abs(ymax - ymin))
         return xmin - px, xmax + px, ymin - py, ymax + py
 
-    def _redraw(rescale=False, emit=True):
+    def _redraw(rescale=False, emit=True, blit=False):
         _ensure_artists()
         try:
             a, t0, x1 = _get_vals()
@@ -284,7 +358,10 @@ def open_heaviside_editor(owner, a_init, t0_init, x1_init, on_change=None, on_ap
             ax.set_xlim(xmin, xmax); ax.set_ylim(ymin, ymax)
 
         _apply_axis_labels(ax, axis_labels)
-        canvas.draw_idle()
+        if blit:
+            _blit(canvas, ax, blit_state, (step_line, t0_vline, amp_handle))
+        else:
+            canvas.draw_idle()
         if emit and on_change:
             on_change(a, t0, x1)
 
@@ -300,25 +377,35 @@ def open_heaviside_editor(owner, a_init, t0_init, x1_init, on_change=None, on_ap
         tol_x = 0.03 * max(1.0, x1 - t0)
         tol_y = 0.12 * max(1.0, abs(a) if a != 0 else 1.0)
         if abs(ev.xdata - hx) < tol_x and abs(ev.ydata - a) < tol_y:
-            drag["amp"] = True; drag["t0"] = False; return
+            drag["amp"] = True; drag["t0"] = False
         # else check near the t0 vertical
-        if abs(ev.xdata - t0) < 0.02 * max(1.0, x1 - t0):
-            drag["t0"] = True; drag["amp"] = False; return
+        elif abs(ev.xdata - t0) < 0.02 * max(1.0, x1 - t0):
+            drag["t0"] = True; drag["amp"] = False
+        else:
+            return
+        _set_animated((step_line, t0_vline, amp_handle), True)
+        blit_state.clear()
 
     def _motion(ev):
-        if ev.inaxes != ax: return
+        if ev.inaxes != ax or not (drag["amp"] or drag["t0"]): return
         try:
             a, t0, x1 = _get_vals()
         except ValueError:
             return
         if drag["amp"]:
-            a = float(ev.ydata); v_a.set(str(a))
+            live["a"] = float(ev.ydata)
         elif drag["t0"]:
-            t0 = min(float(ev.xdata), x1 - 1e-6); v_x0.set(str(t0))
-        _redraw(rescale=False, emit=True)  # NEW: stable limits while dragging
+            live["t0"] = min(float(ev.xdata), x1 - 1e-6)
+        _schedule_redraw()
 
     def _release(_ev):
+        if drag["amp"] or drag["t0"]:
+            _set_animated((step_line, t0_vline, amp_handle), False)
+            blit_state.clear()
         drag["amp"] = drag["t0"] = False
+        synced = dict(live); live.clear()
+        if "a" in synced: v_a.set(str(synced["a"]))
+        if "t0" in synced: v_x0.set(str(synced["t0"]))
         _redraw(rescale=False, emit=True)
 
     def _apply():
@@ -330,12 +417,25 @@ def open_heaviside_editor(owner, a_init, t0_init, x1_init, on_change=None, on_ap
             on_apply(a, t0, x1)
         _redraw(rescale=True, emit=True)
 
-    fig.canvas.mpl_connect("button_press_event", _press)
-    fig.canvas.mpl_connect("motion_notify_event", _motion)
-    fig.canvas.mpl_connect("button_release_event", _release)
+    _connect(shell, "button_press_event", _press)
+    _connect(shell, "motion_notify_event", _motion)
+    _connect(shell, "button_release_event", _release)
+
+    # Live edits are coalesced: a burst of drags/keystrokes redraws at most ~30 fps
+    pending_redraw = [None]
+
+    def _flush_redraw():
+        pending_redraw[0] = None
+        if win.winfo_exists() and shell["session"] is session:
+            # stable limits while dragging; only the moving artists are blitted
+            _redraw(rescale=False, emit=True, blit=drag["amp"] or drag["t0"])
+
+    def _schedule_redraw(*_):
+        if pending_redraw[0] is None:
+            pending_redraw[0] = win.after(int(_MOTION_INTERVAL_S * 1000), _flush_redraw)
 
     for var in (v_a, v_x0, v_x1):
-        var.trace_add("write", lambda *_: _redraw(rescale=False, emit=True))
+        var.trace_add("write", _schedule_redraw)
 
     _redraw(rescale=True, emit=True)
 
@@ -349,19 +449,10 @@ def open_piecewise_editor(owner, pts_init, on_change=None, on_apply=None, on_sav
     on_change(new_pts) called whenever points change (drag, insert, remove, apply)
     on_apply(new_pts) called when the user clicks Apply/Use in target
     """
-    win = tk.Toplevel(owner)
-    win.title("Piecewise Linear Editor")
-    win.geometry("900x610")
-    apply_modern_theme(win)
-    win.configure(bg=COLORS["bg_primary"])
-
-    # --- figure & axes
-    fig = Figure(figsize=(7.9, 4.3))
-    ax = fig.add_subplot(111); ax.grid(True); _apply_axis_labels(ax, axis_labels)
-    canvas = FigureCanvasTkAgg(fig, master=win)
-    canvas_widget = canvas.get_tk_widget()
-    canvas_widget.configure(bg=COLORS["bg_primary"], highlightthickness=0)
-    canvas_widget.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+    # --- figure & axes (reused across opens)
+    shell = _editor_shell(owner, "piecewise", "Piecewise Linear Editor", "900x610", (7.9, 4.3))
+    win, ax, canvas = shell["win"], shell["ax"], shell["canvas"]
+    ax.grid(True); _apply_axis_labels(ax, axis_labels)
 
     # --- toolbar (entries + buttons)
     bar = ttk.Frame(win, style="Card.TFrame"); bar.pack(fill=tk.X, padx=8, pady=6)
@@ -405,8 +496,13 @@ def open_piecewise_editor(owner, pts_init, on_change=None, on_apply=None, on_sav
     # --- state
     pts = sorted([(float(x), float(y)) for (x, y) in (pts_init or [(0.0, 0.0), (1.0, 1.0)])], key=lambda p: p[0])
     drag = {"i": None}
+    last_motion = [0.0]
+    blit_state = {}  # cached axes background while dragging
     line_artist = None
     scatter_artist = None
+    # (N, 2) float copy of pts backing both artists; rebuilt on structural changes,
+    # written in place while a point is dragged
+    pts_xy = np.empty((0, 2))
 
     def _ensure_artists():
         nonlocal line_artist, scatter_artist
@@ -457,10 +553,11 @@ def open_piecewise_editor(owner, pts_init, on_change=None, on_apply=None, on_sav
 
     # --- core redraw
     def _redraw(rescale=False, emit=True, select_idx=None):
+        nonlocal pts_xy
         _ensure_artists()
-        xs = [p[0] for p in pts]; ys = [p[1] for p in pts]
-        line_artist.set_data(xs, ys)
-        scatter_artist.set_offsets(np.c_[xs, ys])
+        pts_xy = np.array(pts, dtype=float).reshape(-1, 2)
+        line_artist.set_data(pts_xy[:, 0], pts_xy[:, 1])
+        scatter_artist.set_offsets(pts_xy)
         ax.grid(True)
         _apply_axis_labels(ax, axis_labels)
         if rescale or autoscale.get():  # NEW
@@ -523,6 +620,8 @@ def open_piecewise_editor(owner, pts_init, on_change=None, on_apply=None, on_sav
         if not xs: return
         i = int(np.argmin(np.abs(np.array(xs) - float(ev.xdata))))
         drag["i"] = i
+        _set_animated((line_artist, scatter_artist), True)
+        blit_state.clear()
 
     def _on_motion(ev):
         if ev.inaxes != ax or drag["i"] is None: return
@@ -533,12 +632,38 @@ def open_piecewise_editor(owner, pts_init, on_change=None, on_apply=None, on_sav
         new_x = float(np.clip(ev.xdata, x_left, x_right))
         new_y = float(ev.ydata)
         pts[i] = (new_x, new_y)
+        # pts always tracks the cursor; only the redraw is rate-limited (release catches up)
+        now = time.monotonic()
+        if now - last_motion[0] < _MOTION_INTERVAL_S:
+            return
+        last_motion[0] = now
         if not autoscale.get():
             _expand_to_fit(new_x, new_y)  # NEW: keep visible while dragging
-        _redraw(rescale=False, emit=True, select_idx=i)
+        _drag_redraw(i)
+
+    def _drag_redraw(i):
+        """Motion fast path: only point i moved, so patch it in place."""
+        x, y = pts[i]
+        pts_xy[i, 0] = x; pts_xy[i, 1] = y
+        line_artist.set_data(pts_xy[:, 0], pts_xy[:, 1])
+        scatter_artist.set_offsets(pts_xy)
+        if autoscale.get():
+            _set_limits()
+        _blit(canvas, ax, blit_state, (line_artist, scatter_artist))
+        rowid = table.get_children()[i]
+        table.item(rowid, values=(i, f"{x}", f"{y}"))
+        if table.selection() != (rowid,):
+            table.selection_set(rowid)
+        if on_change: on_change(list(pts))
 
     def _on_release(_ev):
+        i = drag["i"]
         drag["i"] = None
+        if i is not None:
+            _set_animated((line_artist, scatter_artist), False)
+            blit_state.clear()
+            if not autoscale.get():
+                _expand_to_fit(*pts[i])  # the last motion may have been throttled
         _redraw(rescale=False, emit=True)
 
     # NEW: double-click add (also supports outside current span)
@@ -585,9 +710,9 @@ def open_piecewise_editor(owner, pts_init, on_change=None, on_apply=None, on_sav
         _redraw(rescale=(autoscale.get()), emit=True, select_idx=idx)  # NEW
 
     # --- wire events
-    fig.canvas.mpl_connect("button_press_event", _on_press)
-    fig.canvas.mpl_connect("motion_notify_event", _on_motion)
-    fig.canvas.mpl_connect("button_release_event", _on_release)
+    _connect(shell, "button_press_event", _on_press)
+    _connect(shell, "motion_notify_event", _on_motion)
+    _connect(shell, "button_release_event", _on_release)
 
     # initial draw
     _set_limits()
@@ -15,6 +15,7 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from .ui_theme import COLORS as THEME_COLORS, apply_modern_theme
 
 _DB_FLOOR = 1e-30
+_NOISE_QUANTITIES = frozenset(("onoise", "onoise_db", "inoise", "inoise_db"))
 
 
 def _safe_to_db(value: float) -> float:
@@ -621,7 +622,12 @@ class OptimizationSummary(tk.Frame):
 
     def _load_context(self) -> None:
         self.curveData = self.controller.get_app_data("optimization_settings") or {}
-        self.testRows = self.controller.get_app_data("generated_data") or []
+        generated_data = self.controller.get_app_data("generated_data")
+        # Targets may arrive as an (N, 2) ndarray; the optimizer process expects plain rows
+        if generated_data is None or len(generated_data) == 0:
+            self.testRows = []
+        else:
+            self.testRows = np.asarray(generated_data, dtype=float).tolist()
         self.netlistPath = self.controller.get_app_data("netlist_path")
         self.netlistObject = self.controller.get_app_data("netlist_object")
         self.selectedParameters = self.controller.get_app_data("selected_parameters")
@@ -633,7 +639,7 @@ class OptimizationSummary(tk.Frame):
         self.ac_response = (self.ac_settings.get("response") or "magnitude").lower()
         self.noise_settings = self.curveData.get("noise_settings") or {}
         self.noise_quantity = (self.noise_settings.get("quantity") or "onoise").lower()
-        if self.noise_quantity not in {"onoise", "onoise_db", "inoise", "inoise_db"}:
+        if self.noise_quantity not in _NOISE_QUANTITIES:
             self.noise_quantity = "onoise"
         self.x_parameter = self.curveData.get("x_parameter", "TIME")
         default_x_label = "Frequency (Hz)" if self.analysis_type in {"ac", "noise"} else "Time (s)"
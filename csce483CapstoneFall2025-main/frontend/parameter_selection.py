@@ -258,9 +258,11 @@ class ParameterSelectionWindow(tk.Frame):
         self.controller.navigate("netlist_uploader")
 
     def go_forward(self):
-        self.controller.update_app_data("selected_parameters", self.selected_parameters)
-        self.controller.update_app_data("nodes", self.nodes)
-        self.controller.update_app_data("source_names", self.sources)
+        self.controller.update_app_data_bulk({
+            "selected_parameters": self.selected_parameters,
+            "nodes": self.nodes,
+            "source_names": self.sources,
+        })
         # Placeholder for now
         self.controller.navigate("optimization_settings")
 
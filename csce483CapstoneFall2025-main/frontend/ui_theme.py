@@ -92,6 +92,18 @@ def apply_modern_theme(root: tk.Misc) -> ttk.Style:
         foreground=COLORS["text_primary"],
         font=FONTS["heading"],
     )
+    style.configure(
+        "Card.TLabel",
+        background=COLORS["bg_secondary"],
+        foreground=COLORS["text_primary"],
+        font=FONTS["body"],
+    )
+    style.configure(
+        "CardSubheading.TLabel",
+        background=COLORS["bg_secondary"],
+        foreground=COLORS["text_primary"],
+        font=FONTS["subheading"],
+    )
     style.configure(
         "Hint.TLabel",
         background=COLORS["bg_secondary"],
@@ -43,43 +43,43 @@ def open_executable_dialog() -> Optional[str]:
     return file_path or None
 
 
-def import_constraints_from_file() -> Optional[List[Dict[str, str]]]:
-    """Opens a file dialog to import constraints from a JSON file."""
+def ask_constraints_file_path() -> Optional[str]:
+    """Opens a file dialog to pick a constraints JSON file."""
     file_path = filedialog.askopenfilename(
         title="Import Constraints",
         filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
     )
-    if not file_path:
-        return None  # User cancelled
+    return file_path or None
+
 
+def load_constraints_file(file_path: str) -> List[Dict[str, str]]:
+    """Reads and validates a constraints JSON file without touching Tk.
+
+    Raises ValueError with a user-facing message on any failure, so it can
+    run on a worker thread.
+    """
     try:
         with open(file_path, "r") as f:
             constraints = json.load(f)
-        # Validate the imported data
-        if not isinstance(constraints, list):
-            raise ValueError("Invalid constraints file format: must be a list.")
-        for constraint in constraints:
-            if not isinstance(constraint, dict):
-                raise ValueError("Invalid constraint format: must be a dictionary.")
-            if not all(
-                key in constraint for key in ["left", "operator", "right"]
-            ):  # Check if the dict has the keys.
-                raise ValueError(
-                    "Invalid constraint format: must contain 'left', 'operator', and 'right' keys."
-                )
-        return constraints
     except FileNotFoundError:
-        messagebox.showerror("Error", f"File not found: {file_path}")
-        return None
+        raise ValueError(f"File not found: {file_path}")
     except json.JSONDecodeError:
-        messagebox.showerror("Error", f"Invalid JSON format in file: {file_path}")
-        return None
-    except ValueError as e:
-        messagebox.showerror("Error", str(e))
-        return None
+        raise ValueError(f"Invalid JSON format in file: {file_path}")
     except Exception as e:
-        messagebox.showerror("Error", f"An unexpected error occurred: {e}")
-        return None
+        raise ValueError(f"An unexpected error occurred: {e}")
+    # Validate the imported data
+    if not isinstance(constraints, list):
+        raise ValueError("Invalid constraints file format: must be a list.")
+    for constraint in constraints:
+        if not isinstance(constraint, dict):
+            raise ValueError("Invalid constraint format: must be a dictionary.")
+        if not all(
+            key in constraint for key in ["left", "operator", "right"]
+        ):  # Check if the dict has the keys.
+            raise ValueError(
+                "Invalid constraint format: must contain 'left', 'operator', and 'right' keys."
+            )
+    return constraints
 
 
 def export_constraints_to_file(constraints: List[Dict[str, str]]) -> None:
@@ -0,0 +1,117 @@
+import tkinter as tk
+import unittest
+from unittest import mock
+
+from frontend.optimization_settings.constraint_table import ConstraintTable
+
+
+def _constraint(i):
+    return {"left": f"R{i}", "operator": "=", "right": str(i)}
+
+
+class ConstraintTableTests(unittest.TestCase):
+    def setUp(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.table = ConstraintTable(
+            tk.Frame(self.root),
+            add_callback=lambda: None,
+            remove_callback=lambda: None,
+            edit_callback=lambda constraint, index: None,
+        )
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def _lefts(self):
+        return [self.table.item(iid, "values")[0] for iid in self.table.get_children()]
+
+    def test_index_of_follows_rows_after_remove(self):
+        for i in range(5):
+            self.table.add_constraint(_constraint(i))
+        children = self.table.get_children()
+
+        removed = self.table.remove_rows([children[1], children[3]])
+
+        self.assertEqual(removed, [3, 1])
+        self.assertEqual(self._lefts(), ["R0", "R2", "R4"])
+        for position, iid in enumerate(self.table.get_children()):
+            self.assertEqual(self.table.index_of(iid), position)
+
+    def test_removing_every_row_clears_the_table(self):
+        for i in range(3):
+            self.table.add_constraint(_constraint(i))
+
+        removed = self.table.remove_rows(self.table.get_children())
+
+        self.assertEqual(removed, [2, 1, 0])
+        self.assertEqual(self.table.get_children(), ())
+        self.assertEqual(self.table._rows, [])
+
+    def test_windowed_rows_map_to_offset_indices(self):
+        self.table.configure(height=2)
+        with mock.patch("frontend.optimization_settings.constraint_table._VIRTUAL_THRESHOLD", 3):
+            self.table.add_constraints_bulk([_constraint(i) for i in range(5)])
+            self.assertEqual(self._lefts(), ["R0", "R1"])
+
+            self.table._scroll_rows(2)
+            self.assertEqual(self._lefts(), ["R2", "R3"])
+            first = self.table.get_children()[0]
+            self.assertEqual(self.table.index_of(first), 2)
+
+            removed = self.table.remove_rows([first])
+
+            self.assertEqual(removed, [2])
+            self.assertEqual([row["left"] for row in self.table._rows], ["R0", "R1", "R3", "R4"])
+            self.assertEqual(self._lefts(), ["R3", "R4"])
+            for position, iid in enumerate(self.table.get_children()):
+                self.assertEqual(self.table.index_of(iid), 2 + position)
+
+    def test_windowed_yview_and_selection_follow_the_offset(self):
+        self.table.configure(height=2)
+        with mock.patch("frontend.optimization_settings.constraint_table._VIRTUAL_THRESHOLD", 3):
+            self.table.add_constraints_bulk([_constraint(i) for i in range(8)])
+            self.table.selection_set(self.table.get_children()[1])
+
+            self.table.yview("moveto", 0.5)
+            self.assertEqual(self._lefts(), ["R4", "R5"])
+            self.assertEqual(self.table.yview(), (0.5, 0.75))
+            self.assertEqual(self.table.selection(), ())
+
+            self.table.yview("moveto", 0.0)
+            self.assertEqual([self.table.index_of(iid) for iid in self.table.selection()], [1])
+
+    def test_keyboard_navigation_moves_past_the_window(self):
+        self.table.configure(height=2)
+        with mock.patch("frontend.optimization_settings.constraint_table._VIRTUAL_THRESHOLD", 3):
+            self.table.add_constraints_bulk([_constraint(i) for i in range(5)])
+            self.table.focus(self.table.get_children()[1])
+
+            self.table._on_key(1)
+            self.assertEqual(self._lefts(), ["R1", "R2"])
+            self.assertEqual(self.table.index_of(self.table.focus()), 2)
+
+            self.table._on_key("end")
+            self.assertEqual(self._lefts(), ["R3", "R4"])
+            self.assertEqual(self.table.index_of(self.table.focus()), 4)
+
+    def test_zero_wheel_delta_does_not_scroll(self):
+        self.table.configure(height=2)
+        with mock.patch("frontend.optimization_settings.constraint_table._VIRTUAL_THRESHOLD", 3):
+            self.table.add_constraints_bulk([_constraint(i) for i in range(5)])
+
+            self.table._on_mousewheel(mock.Mock(delta=0))
+
+            self.assertEqual(self._lefts(), ["R0", "R1"])
+
+    def test_update_constraint_refreshes_visible_row(self):
+        for i in range(3):
+            self.table.add_constraint(_constraint(i))
+
+        self.table.update_constraint(1, {"left": "C1", "operator": ">=", "right": "1n"})
+
+        self.assertEqual(self._lefts(), ["R0", "C1", "R2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from frontend.optimization_settings.curve_fit_settings import CurveFitSettings, _XRangeIndex
+
+_MODULE = "frontend.optimization_settings.curve_fit_settings"
+
+
+class XRangeIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = _XRangeIndex()
+        self.index.add(0.0, 1.0)
+        self.index.add(2.0, 3.0)
+
+    def test_overlapping_ranges_are_detected(self):
+        self.assertTrue(self.index.overlaps(0.5, 1.5))
+        self.assertTrue(self.index.overlaps(-1.0, 0.5))
+        self.assertTrue(self.index.overlaps(1.5, 2.5))
+        self.assertTrue(self.index.overlaps(-1.0, 4.0))
+
+    def test_touching_ranges_do_not_overlap(self):
+        self.assertFalse(self.index.overlaps(1.0, 2.0))
+        self.assertFalse(self.index.overlaps(-1.0, 0.0))
+        self.assertFalse(self.index.overlaps(3.0, 4.0))
+
+    def test_zero_length_ranges(self):
+        self.assertTrue(self.index.overlaps(0.5, 0.5))
+        self.assertFalse(self.index.overlaps(1.0, 1.0))
+        self.assertFalse(self.index.overlaps(1.5, 1.5))
+
+        self.index.add(5.0, 5.0)
+        self.assertTrue(self.index.overlaps(4.0, 6.0))
+
+    def test_remove_picks_the_exact_range(self):
+        self.index.add(0.0, 0.0)  # touches (0, 1) at its start
+        self.index.remove(0.0, 1.0)
+
+        self.assertEqual(list(self.index), [(0.0, 0.0), (2.0, 3.0)])
+        self.assertFalse(self.index.overlaps(0.5, 0.75))
+
+    def test_remove_unknown_range_is_a_no_op(self):
+        self.index.remove(0.0, 2.0)
+
+        self.assertEqual(list(self.index), [(0.0, 1.0), (2.0, 3.0)])
+
+
+class CurveFileLoadingTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        # The loaders only use module constants, so no widgets are needed
+        self.settings = CurveFitSettings.__new__(CurveFitSettings)
+        print_patch = mock.patch("builtins.print")
+        print_patch.start()
+        self.addCleanup(print_patch.stop)
+
+    def _write(self, text):
+        path = Path(self.tmpdir.name) / "curve.csv"
+        path.write_text(text)
+        return str(path)
+
+    def test_clean_file_uses_the_array_path(self):
+        path = self._write("0,1\n1,2.5\n2,4\n")
+
+        data = self.settings._load_curve_array(path)
+
+        self.assertEqual(data.tolist(), [[0.0, 1.0], [1.0, 2.5], [2.0, 4.0]])
+
+    def test_header_falls_back_to_row_reader(self):
+        path = self._write("time,voltage\n0,1\n1,2\n")
+
+        self.assertIsNone(self.settings._load_curve_array(path))
+        self.assertEqual(self.settings._read_csv_rows(path), [[0.0, 1.0], [1.0, 2.0]])
+
+    def test_wrong_column_count_falls_back(self):
+        path = self._write("0,1,2\n1,2,3\n")
+
+        self.assertIsNone(self.settings._load_curve_array(path))
+        self.assertEqual(self.settings._read_csv_rows(path), [])
+
+    def test_row_cap_truncates_both_paths(self):
+        path = self._write("".join(f"{i},{i * 2}\n" for i in range(10)))
+        header_path = str(Path(self.tmpdir.name) / "header.csv")
+        Path(header_path).write_text("x,y\n" + "".join(f"{i},{i}\n" for i in range(10)))
+
+        with mock.patch(f"{_MODULE}._MAX_CURVE_ROWS", 4), mock.patch(f"{_MODULE}._CSV_CHUNK_ROWS", 3):
+            data = self.settings._load_curve_array(path)
+            rows = self.settings._read_csv_rows(header_path)
+
+        self.assertEqual(data.tolist(), [[0.0, 0.0], [1.0, 2.0], [2.0, 4.0], [3.0, 6.0]])
+        self.assertEqual(rows, [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0], [3.0, 3.0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
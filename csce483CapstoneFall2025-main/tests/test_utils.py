@@ -0,0 +1,58 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from frontend.utils import load_constraints_file
+
+
+class LoadConstraintsFileTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _write(self, text):
+        path = Path(self.tmpdir.name) / "constraints.json"
+        path.write_text(text)
+        return str(path)
+
+    def test_valid_file_returns_constraints(self):
+        constraints = [
+            {"left": "R1", "operator": ">=", "right": "1k"},
+            {"left": "V(out)", "operator": "<=", "right": "5", "x_min": 0.0, "x_max": 1.0},
+        ]
+        path = self._write(json.dumps(constraints))
+
+        self.assertEqual(load_constraints_file(path), constraints)
+
+    def test_malformed_json_raises_value_error(self):
+        path = self._write('[{"left": "R1", "operator": ">="')
+
+        with self.assertRaises(ValueError):
+            load_constraints_file(path)
+
+    def test_non_list_top_level_raises_value_error(self):
+        path = self._write(json.dumps({"left": "R1", "operator": "=", "right": "1"}))
+
+        with self.assertRaises(ValueError):
+            load_constraints_file(path)
+
+    def test_non_dict_entry_raises_value_error(self):
+        path = self._write(json.dumps([["R1", "=", "1"]]))
+
+        with self.assertRaises(ValueError):
+            load_constraints_file(path)
+
+    def test_missing_keys_raise_value_error(self):
+        path = self._write(json.dumps([{"left": "R1", "operator": "="}]))
+
+        with self.assertRaises(ValueError):
+            load_constraints_file(path)
+
+    def test_missing_file_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            load_constraints_file(str(Path(self.tmpdir.name) / "missing.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()